@@ -0,0 +1,32 @@
+"""Initial schema
+
+Creates every table from the current Declarative metadata. Databases
+previously bootstrapped by Base.metadata.create_all adopt the chain
+with `alembic stamp 0001` followed by `alembic upgrade head`, so the
+legacy shims (0002 uuid cast, 0003 constraint/column backfill) and the
+later schema revisions still run. Stamping head would skip them and
+leave the database missing constraints the code relies on.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-09-01
+
+"""
+from alembic import op
+
+from app.db.session import Base
+from app.db import models  # noqa: F401  (registers all tables on Base)
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    Base.metadata.create_all(op.get_bind())
+
+
+def downgrade() -> None:
+    Base.metadata.drop_all(op.get_bind())
@@ -0,0 +1,99 @@
+"""Convert legacy String(36) id columns to native uuid
+
+Databases bootstrapped before the models moved to the Uuid type store
+ids as VARCHAR(36); the ORM now binds uuid.UUID values, and later
+revisions (the points_ledger partition rebuild) copy these columns into
+uuid-typed tables. Casts every id/foreign-key column with USING
+::uuid. Foreign keys are dropped for the duration of the type change —
+PostgreSQL refuses to alter one side of a varchar FK pair to uuid —
+and recreated from their saved definitions afterwards.
+
+No-op on databases whose columns are already uuid (anything created by
+0001's create_all) and on SQLite, where legacy dev databases should
+simply be recreated with `alembic upgrade head`.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-09-01
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+_UUID_COLUMNS = [
+    ("users", "id"),
+    ("taste_profiles", "id"),
+    ("taste_profiles", "user_id"),
+    ("articles", "id"),
+    ("article_summaries", "id"),
+    ("article_summaries", "article_id"),
+    ("article_jargon", "id"),
+    ("article_jargon", "article_id"),
+    ("points_ledger", "id"),
+    ("points_ledger", "user_id"),
+    ("points_ledger", "reference_id"),
+    ("weekly_quizzes", "id"),
+    ("quiz_questions", "id"),
+    ("quiz_questions", "quiz_id"),
+    ("quiz_questions", "article_id"),
+    ("quiz_attempts", "id"),
+    ("quiz_attempts", "user_id"),
+    ("quiz_attempts", "quiz_id"),
+    ("quiz_answers", "id"),
+    ("quiz_answers", "attempt_id"),
+    ("quiz_answers", "question_id"),
+    ("leaderboard_cache", "id"),
+    ("leaderboard_cache", "user_id"),
+]
+
+_TABLES = sorted({table for table, _ in _UUID_COLUMNS})
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # Fresh databases already have uuid columns from create_all
+    users_id_type = bind.exec_driver_sql(
+        "SELECT data_type FROM information_schema.columns"
+        " WHERE table_name = 'users' AND column_name = 'id'"
+    ).scalar()
+    if users_id_type != "character varying":
+        return
+
+    fks = bind.exec_driver_sql(
+        "SELECT conrelid::regclass::text AS table_name, conname,"
+        "       pg_get_constraintdef(oid) AS definition"
+        " FROM pg_constraint"
+        " WHERE contype = 'f' AND conrelid::regclass::text = ANY(%s)",
+        (_TABLES,),
+    ).mappings().all()
+
+    for fk in fks:
+        op.execute(
+            f'ALTER TABLE {fk["table_name"]} DROP CONSTRAINT {fk["conname"]}'
+        )
+
+    for table, column in _UUID_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE uuid USING {column}::uuid"
+        )
+
+    for fk in fks:
+        op.execute(
+            f'ALTER TABLE {fk["table_name"]} '
+            f'ADD CONSTRAINT {fk["conname"]} {fk["definition"]}'
+        )
+
+
+def downgrade() -> None:
+    # One-way legacy shim: 0001's schema already uses uuid columns, so
+    # there is no varchar state to restore
+    pass
@@ -0,0 +1,178 @@
+"""Backfill constraints and columns the current code depends on
+
+Databases that predate this revision chain are missing schema the
+application now requires at runtime: the (article_id, mode) unique
+constraint targeted by the summary upsert, the unique source_url index
+targeted by ON CONFLICT ingestion, the (user_id, week_start) unique
+constraint targeted by the leaderboard refresh, the
+quiz_attempts.max_score / weekly_quizzes.is_active columns, and the
+secondary indexes behind keyset pagination, the quiz accuracy
+aggregate, and the leaderboard scan. Without the constraints every
+ingest, summary save, and leaderboard refresh fails with "no unique or
+exclusion constraint matching the ON CONFLICT specification"; without
+the indexes those queries fall back to sequential scans. Each piece is
+added only if missing, and duplicate
+rows that would violate a new unique constraint are cleared first
+(keeping one arbitrary row per key — summaries and leaderboard rows
+are regenerated anyway).
+
+No-op on fresh databases (0001's create_all emits all of this) and on
+SQLite, where legacy dev databases should be recreated with
+`alembic upgrade head`.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-09-01
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+
+def _has_constraint(bind, name: str) -> bool:
+    return bind.exec_driver_sql(
+        "SELECT 1 FROM pg_constraint WHERE conname = %s", (name,)
+    ).first() is not None
+
+
+def _index_is_unique(bind, name: str):
+    """Return the index's uniqueness, or None if it does not exist."""
+    return bind.exec_driver_sql(
+        "SELECT ix.indisunique FROM pg_index ix"
+        " JOIN pg_class c ON c.oid = ix.indexrelid"
+        " WHERE c.relname = %s",
+        (name,),
+    ).scalar()
+
+
+def _has_column(bind, table: str, column: str) -> bool:
+    return bind.exec_driver_sql(
+        "SELECT 1 FROM information_schema.columns"
+        " WHERE table_name = %s AND column_name = %s",
+        (table, column),
+    ).first() is not None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    # articles.source_url unique index (ON CONFLICT target for ingest).
+    # Duplicate articles are removed child-tables-first to satisfy the
+    # foreign keys; quiz questions keep their text and just lose the
+    # article link.
+    unique = _index_is_unique(bind, "ix_articles_source_url")
+    if not unique:
+        op.execute(
+            """
+            CREATE TEMP TABLE _dup_articles AS
+            SELECT a.id FROM articles a
+            JOIN articles b
+              ON a.source_url = b.source_url AND a.ctid > b.ctid
+            WHERE a.source_url IS NOT NULL
+            """
+        )
+        op.execute(
+            "DELETE FROM article_summaries"
+            " WHERE article_id IN (SELECT id FROM _dup_articles)"
+        )
+        op.execute(
+            "DELETE FROM article_jargon"
+            " WHERE article_id IN (SELECT id FROM _dup_articles)"
+        )
+        op.execute(
+            "UPDATE quiz_questions SET article_id = NULL"
+            " WHERE article_id IN (SELECT id FROM _dup_articles)"
+        )
+        op.execute(
+            "DELETE FROM articles WHERE id IN (SELECT id FROM _dup_articles)"
+        )
+        op.execute("DROP TABLE _dup_articles")
+        if unique is not None:
+            op.drop_index("ix_articles_source_url", table_name="articles")
+        op.create_index(
+            "ix_articles_source_url", "articles", ["source_url"], unique=True
+        )
+
+    # One summary per (article_id, mode): upsert target for the consumer
+    if not _has_constraint(bind, "uq_summary_article_mode"):
+        op.execute(
+            """
+            DELETE FROM article_summaries a
+            USING article_summaries b
+            WHERE a.article_id = b.article_id AND a.mode = b.mode
+              AND a.ctid < b.ctid
+            """
+        )
+        op.create_unique_constraint(
+            "uq_summary_article_mode", "article_summaries",
+            ["article_id", "mode"],
+        )
+
+    # One cache row per (user_id, week_start): leaderboard upsert target
+    if not _has_constraint(bind, "uq_leaderboard_user_week"):
+        op.execute(
+            """
+            DELETE FROM leaderboard_cache a
+            USING leaderboard_cache b
+            WHERE a.user_id = b.user_id AND a.week_start = b.week_start
+              AND a.ctid < b.ctid
+            """
+        )
+        op.create_unique_constraint(
+            "uq_leaderboard_user_week", "leaderboard_cache",
+            ["user_id", "week_start"],
+        )
+
+    # Columns added to the models after the legacy schema shipped
+    if not _has_column(bind, "quiz_attempts", "max_score"):
+        op.add_column(
+            "quiz_attempts",
+            sa.Column("max_score", sa.Integer(), server_default="0"),
+        )
+        op.alter_column("quiz_attempts", "max_score", server_default=None)
+    if not _has_column(bind, "weekly_quizzes", "is_active"):
+        op.add_column(
+            "weekly_quizzes",
+            sa.Column("is_active", sa.Boolean(), server_default=sa.text("true")),
+        )
+        op.alter_column("weekly_quizzes", "is_active", server_default=None)
+
+    # Secondary indexes that otherwise only exist via 0001's create_all
+    op.create_index(
+        "idx_article_category_ingested",
+        "articles",
+        ["category", sa.text("ingested_at DESC"), sa.text("id DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_article_category_published",
+        "articles",
+        ["category", sa.text("published_at DESC")],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_quiz_attempt_user_completed",
+        "quiz_attempts",
+        ["user_id", "completed_at"],
+        if_not_exists=True,
+    )
+    op.create_index(
+        "idx_leaderboard_week_points",
+        "leaderboard_cache",
+        ["week_start", sa.text("weekly_points DESC")],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    # One-way legacy shim: fresh databases get all of this from 0001,
+    # so there is no prior state to restore
+    pass
@@ -0,0 +1,55 @@
+"""Convert JSON columns to jsonb and add GIN index on preferred_categories
+
+jsonb is stored binary (no re-parse on read) and supports containment
+operators, enabling the GIN-backed personalization lookups. No-op on
+SQLite, where the columns stay plain JSON.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-09-01
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+_JSONB_COLUMNS = [
+    ("taste_profiles", "preferred_categories"),
+    ("taste_profiles", "topic_weights"),
+    ("articles", "fact_check_claims"),
+    ("quiz_questions", "options"),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column in _JSONB_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE jsonb USING {column}::jsonb"
+        )
+    # Fresh databases already get this index from 0001's create_all
+    # (it lives in TasteProfile.__table_args__), so guard the create
+    op.create_index(
+        "ix_taste_prefcats_gin",
+        "taste_profiles",
+        ["preferred_categories"],
+        postgresql_using="gin",
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_taste_prefcats_gin", table_name="taste_profiles")
+    for table, column in _JSONB_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE json USING {column}::json"
+        )
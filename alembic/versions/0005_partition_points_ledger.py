@@ -0,0 +1,149 @@
+"""Range-partition points_ledger by month on earned_at
+
+Rebuilds points_ledger as a declaratively partitioned table (monthly
+partitions plus a DEFAULT catch-all for historical rows) and installs
+points_ledger_ensure_partition(month_start) for ops to call ahead of
+each month boundary — e.g. a monthly cron running
+`SELECT points_ledger_ensure_partition(date_trunc('month', now() + interval '1 month')::date)`.
+Creating a month's partition only works while the DEFAULT partition
+holds no rows in that range, so keep the cron ahead of the clock.
+
+No-op on SQLite. PostgreSQL requires the partition key in every unique
+constraint, hence the (id, earned_at) primary key.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-09-01
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+_ENSURE_PARTITION_FN = """
+CREATE OR REPLACE FUNCTION points_ledger_ensure_partition(month_start date)
+RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    part_name text := 'points_ledger_' || to_char(month_start, 'YYYYMM');
+BEGIN
+    EXECUTE format(
+        'CREATE TABLE IF NOT EXISTS %I PARTITION OF points_ledger '
+        'FOR VALUES FROM (%L) TO (%L)',
+        part_name, month_start, month_start + interval '1 month'
+    );
+END $$;
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    already_partitioned = bind.exec_driver_sql(
+        "SELECT 1 FROM pg_partitioned_table pt"
+        " JOIN pg_class c ON c.oid = pt.partrelid"
+        " WHERE c.relname = 'points_ledger'"
+    ).first()
+
+    if not already_partitioned:
+        op.execute("ALTER TABLE points_ledger RENAME TO points_ledger_old")
+        op.execute(
+            """
+            CREATE TABLE points_ledger (
+                id UUID NOT NULL,
+                user_id UUID NOT NULL REFERENCES users (id),
+                points INTEGER NOT NULL,
+                action_type VARCHAR(50) NOT NULL,
+                reference_id UUID,
+                earned_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                PRIMARY KEY (id, earned_at)
+            ) PARTITION BY RANGE (earned_at)
+            """
+        )
+
+    op.execute(_ENSURE_PARTITION_FN)
+    # Current and next month first; the DEFAULT partition is created
+    # after so historical rows land there without blocking these ranges
+    op.execute(
+        "SELECT points_ledger_ensure_partition(date_trunc('month', now())::date)"
+    )
+    op.execute(
+        "SELECT points_ledger_ensure_partition("
+        "date_trunc('month', now() + interval '1 month')::date)"
+    )
+    op.execute(
+        "CREATE TABLE IF NOT EXISTS points_ledger_default"
+        " PARTITION OF points_ledger DEFAULT"
+    )
+
+    if not already_partitioned:
+        op.execute(
+            """
+            INSERT INTO points_ledger
+                (id, user_id, points, action_type, reference_id, earned_at)
+            SELECT id, user_id, points, action_type, reference_id,
+                   COALESCE(earned_at AT TIME ZONE 'UTC', now())
+            FROM points_ledger_old
+            """
+        )
+        # Frees the old index names before recreating them on the parent
+        op.execute("DROP TABLE points_ledger_old")
+        op.create_index(
+            "idx_points_user_earned",
+            "points_ledger",
+            ["user_id", "earned_at"],
+            postgresql_ops={"earned_at": "DESC"},
+        )
+        op.create_index(
+            "idx_points_user_action_earned",
+            "points_ledger",
+            ["user_id", "action_type", "earned_at"],
+            postgresql_where="action_type = 'read_article'",
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    op.execute("ALTER TABLE points_ledger RENAME TO points_ledger_part")
+    op.execute(
+        """
+        CREATE TABLE points_ledger (
+            id UUID NOT NULL,
+            user_id UUID NOT NULL REFERENCES users (id),
+            points INTEGER NOT NULL,
+            action_type VARCHAR(50) NOT NULL,
+            reference_id UUID,
+            earned_at TIMESTAMP,
+            PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO points_ledger
+            (id, user_id, points, action_type, reference_id, earned_at)
+        SELECT id, user_id, points, action_type, reference_id, earned_at
+        FROM points_ledger_part
+        """
+    )
+    op.execute("DROP TABLE points_ledger_part")
+    op.execute("DROP FUNCTION IF EXISTS points_ledger_ensure_partition(date)")
+    op.create_index(
+        "idx_points_user_earned",
+        "points_ledger",
+        ["user_id", "earned_at"],
+        postgresql_ops={"earned_at": "DESC"},
+    )
+    op.create_index(
+        "idx_points_user_action_earned",
+        "points_ledger",
+        ["user_id", "action_type", "earned_at"],
+        postgresql_where="action_type = 'read_article'",
+    )
@@ -0,0 +1,67 @@
+"""Move timestamp columns to timestamptz with server-side defaults
+
+Existing naive values are reinterpreted as UTC. Defaults move from
+Python datetime.utcnow to the database clock, so INSERTs no longer
+ship a timestamp over the wire and ordering is monotonic with the DB.
+points_ledger.earned_at is excluded here: it is the partition key
+(type changes are disallowed) and migration 0005 already creates it
+as timestamptz with a now() default. No-op on SQLite.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-09-01
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+# (table, column, gets NOT NULL + DEFAULT now())
+_TIMESTAMP_COLUMNS = [
+    ("users", "created_at", True),
+    ("users", "last_login", False),
+    ("articles", "published_at", False),
+    ("articles", "ingested_at", True),
+    ("article_summaries", "generated_at", True),
+    ("weekly_quizzes", "created_at", True),
+    ("quiz_attempts", "started_at", True),
+    ("quiz_attempts", "completed_at", False),
+    ("leaderboard_cache", "updated_at", True),
+]
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, required in _TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE timestamptz "
+            f"USING {column} AT TIME ZONE 'UTC'"
+        )
+        if required:
+            op.execute(
+                f"UPDATE {table} SET {column} = now() WHERE {column} IS NULL"
+            )
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT now(), "
+                f"ALTER COLUMN {column} SET NOT NULL"
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table, column, required in _TIMESTAMP_COLUMNS:
+        if required:
+            op.execute(
+                f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT, "
+                f"ALTER COLUMN {column} DROP NOT NULL"
+            )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE timestamp "
+            f"USING {column} AT TIME ZONE 'UTC'"
+        )
@@ -1,17 +1,25 @@
 from datetime import timedelta
 from typing import Optional, List
+from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, Field
 
 from app.db import get_db, User, TasteProfile
-from app.core.security import create_access_token, get_current_user_id
-from app.core.config import get_settings
+from app.api.user import taste_cache_key
+from app.core.cache import redis_cache
+from app.core.security import (
+    create_access_token, get_current_user_id, oauth2_scheme, revoke_token
+)
+from app.core.config import settings
 from app.services import google_oauth_service
 from app.schemas import UserResponse, Token
 
-settings = get_settings()
 router = APIRouter(prefix="/api/auth", tags=["Authentication"])
 
 
@@ -49,7 +57,7 @@ async def get_google_auth_url():
 @router.post("/google/callback", response_model=Token)
 async def google_callback(
     request: GoogleAuthRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Handle Google OAuth callback.
@@ -59,38 +67,38 @@ async def google_callback(
     try:
         # Authenticate with Google
         google_user = await google_oauth_service.authenticate(request.code)
-        
-        # Check if user exists
-        user = db.query(User).filter(User.email == google_user.email).first()
-        
-        if not user:
-            # Create new user from Google account
-            user = User(
-                email=google_user.email,
-                display_name=google_user.name,
-                google_id=google_user.id,
-                avatar_url=google_user.picture,
-                password_hash="",  # No password for OAuth users
-                profile_complete=False,  # Needs to complete profile
-            )
-            db.add(user)
-            db.commit()
-            db.refresh(user)
-        else:
-            # Update Google info if needed
-            if not user.google_id:
-                user.google_id = google_user.id
-            if google_user.picture and not user.avatar_url:
-                user.avatar_url = google_user.picture
-            db.commit()
-        
+
+        # Single-round-trip upsert keyed on the unique email: inserts a
+        # new user, or backfills google_id/avatar_url on an existing one
+        # without the SELECT-then-branch
+        insert_fn = (
+            sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+        )
+        stmt = insert_fn(User).values(
+            email=google_user.email,
+            display_name=google_user.name,
+            google_id=google_user.id,
+            avatar_url=google_user.picture,
+            password_hash="",  # No password for OAuth users
+            profile_complete=False,  # Needs to complete profile
+        ).on_conflict_do_update(
+            index_elements=["email"],
+            set_={
+                "google_id": func.coalesce(User.google_id, google_user.id),
+                "avatar_url": func.coalesce(User.avatar_url, google_user.picture),
+            },
+        ).returning(User.id, User.profile_complete)
+
+        row = (await db.execute(stmt)).one()
+        await db.commit()
+
         # Create access token
-        access_token = create_access_token(data={"sub": str(user.id)})
-        
+        access_token = create_access_token(data={"sub": str(row.id)})
+
         return {
             "access_token": access_token,
             "token_type": "bearer",
-            "profile_complete": user.profile_complete,
+            "profile_complete": row.profile_complete,
         }
         
     except Exception as e:
@@ -103,8 +111,8 @@ async def google_callback(
 @router.post("/complete-profile", response_model=UserResponse)
 async def complete_profile(
     profile_data: CompleteProfileRequest,
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Complete user profile after OAuth registration.
@@ -115,7 +123,9 @@ async def complete_profile(
     - Preferred news categories
     - Summary mode preference
     """
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (await db.execute(
+        select(User).where(User.id == user_id)
+    )).scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -133,9 +143,9 @@ async def complete_profile(
     user.profile_complete = True
     
     # Create or update taste profile
-    taste_profile = db.query(TasteProfile).filter(
-        TasteProfile.user_id == user.id
-    ).first()
+    taste_profile = (await db.execute(
+        select(TasteProfile).where(TasteProfile.user_id == user.id)
+    )).scalar_one_or_none()
     
     if not taste_profile:
         taste_profile = TasteProfile(
@@ -152,19 +162,32 @@ async def complete_profile(
         if profile_data.age:
             taste_profile.reading_level = min(10, max(1, profile_data.age // 10 + 1))
     
-    db.commit()
-    db.refresh(user)
-    
+    await db.commit()
+
+    # Drop any cached taste profile now that preferences exist
+    await redis_cache.delete(taste_cache_key(user_id))
+
+    # Reload with taste profile for serialization
+    user = (await db.execute(
+        select(User)
+        .where(User.id == user_id)
+        .options(selectinload(User.taste_profile))
+    )).scalar_one()
+
     return user
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_current_user(
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get current authenticated user."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = (await db.execute(
+        select(User)
+        .where(User.id == user_id)
+        .options(selectinload(User.taste_profile))
+    )).scalar_one_or_none()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -174,10 +197,12 @@ async def get_current_user(
 
 
 @router.post("/logout")
-async def logout():
+async def logout(token: str = Depends(oauth2_scheme)):
     """
-    Logout user (client should clear token).
-    
-    For server-side session invalidation, implement token blacklist.
+    Logout user by revoking their token server-side.
+
+    The token's jti is blacklisted in Redis until the token would
+    have expired anyway; the client should also clear its copy.
     """
+    await revoke_token(token)
     return {"message": "Logged out successfully"}
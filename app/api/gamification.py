@@ -1,20 +1,24 @@
-from datetime import datetime, date, timedelta
+import asyncio
+from datetime import datetime, date, timedelta, timezone
 from typing import Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func, case
+from sqlalchemy import select, func, update
+from sqlalchemy.orm import selectinload, undefer
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import (
-    get_db, User, PointsLedger, WeeklyQuiz, QuizQuestion, 
+    get_db, User, PointsLedger, WeeklyQuiz, QuizQuestion,
     QuizAttempt, QuizAnswer, LeaderboardCache, Article
 )
 from app.core.security import get_current_user_id
 from app.schemas import (
-    PointsHistoryResponse, PointsResponse, LeaderboardResponse, 
-    LeaderboardEntry, QuizResponse, QuizSubmit, QuizResultResponse
+    PointsHistoryResponse, PointsResponse, PointsListAdapter,
+    LeaderboardResponse, LeaderboardEntry, QuizResponse, QuizSubmit,
+    QuizResultResponse
 )
 from app.services import gemini_service
+from app.services import leaderboard as leaderboard_service
 
 router = APIRouter(prefix="/api", tags=["Gamification"])
 
@@ -23,19 +27,26 @@ router = APIRouter(prefix="/api", tags=["Gamification"])
 
 @router.get("/user/points", response_model=PointsHistoryResponse)
 async def get_points_history(
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get user's points history."""
-    points = db.query(PointsLedger).filter(
-        PointsLedger.user_id == user_id
-    ).order_by(PointsLedger.earned_at.desc()).limit(100).all()
-    
-    total = db.query(func.sum(PointsLedger.points)).filter(
-        PointsLedger.user_id == user_id
-    ).scalar() or 0
-    
-    return PointsHistoryResponse(items=points, total_points=total)
+    # SUM() OVER () returns the all-time total alongside the page of
+    # rows, so one query replaces the list + aggregate pair
+    rows = (await db.execute(
+        select(PointsLedger, func.sum(PointsLedger.points).over().label("total"))
+        .where(PointsLedger.user_id == user_id)
+        .order_by(PointsLedger.earned_at.desc())
+        .limit(100)
+    )).all()
+
+    points = [entry for entry, _ in rows]
+    total = rows[0].total if rows else 0
+
+    return PointsHistoryResponse(
+        items=PointsListAdapter.validate_python(points),
+        total_points=total
+    )
 
 
 @router.post("/user/points/award")
@@ -43,8 +54,8 @@ async def award_points(
     action_type: str,
     points: int,
     reference_id: Optional[UUID] = None,
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Award points for an action."""
     # Point values by action type
@@ -57,10 +68,10 @@ async def award_points(
         "learn_jargon": 5,
         "share_article": 10
     }
-    
+
     # Use predefined points or custom value
     actual_points = point_values.get(action_type, points)
-    
+
     ledger_entry = PointsLedger(
         user_id=user_id,
         points=actual_points,
@@ -68,8 +79,8 @@ async def award_points(
         reference_id=reference_id
     )
     db.add(ledger_entry)
-    db.commit()
-    
+    await db.commit()
+
     return {"points_awarded": actual_points, "action_type": action_type}
 
 
@@ -77,18 +88,25 @@ async def award_points(
 async def record_reading_time(
     article_id: UUID,
     seconds: int,
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Record reading time for an article."""
-    user = db.query(User).filter(User.id == user_id).first()
-    if not user:
+    # Atomic in-place increment: no read-modify-write race between
+    # concurrent requests, and no recount scan over the ledger
+    row = (await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(
+            total_reading_time_seconds=func.coalesce(
+                User.total_reading_time_seconds, 0) + seconds,
+            articles_read_count=func.coalesce(User.articles_read_count, 0) + 1,
+        )
+        .returning(User.total_reading_time_seconds, User.articles_read_count)
+    )).one_or_none()
+    if not row:
         raise HTTPException(status_code=404, detail="User not found")
-    
-    # Update cumulative reading time
-    user.total_reading_time_seconds = (user.total_reading_time_seconds or 0) + seconds
-    user.articles_read_count = (user.articles_read_count or 0) + 1
-    
+
     # Award points for completing an article (if reading time > 30 seconds)
     if seconds >= 30:
         ledger_entry = PointsLedger(
@@ -98,13 +116,13 @@ async def record_reading_time(
             reference_id=article_id
         )
         db.add(ledger_entry)
-    
-    db.commit()
-    
+
+    await db.commit()
+
     return {
         "recorded_seconds": seconds,
-        "total_reading_time_seconds": user.total_reading_time_seconds,
-        "articles_read_count": user.articles_read_count
+        "total_reading_time_seconds": row.total_reading_time_seconds,
+        "articles_read_count": row.articles_read_count
     }
 
 
@@ -112,8 +130,8 @@ async def record_reading_time(
 
 @router.get("/leaderboard", response_model=LeaderboardResponse)
 async def get_leaderboard(
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get weekly leaderboard with rankings based on:
@@ -122,66 +140,38 @@ async def get_leaderboard(
     - Total points
     """
     # Get current week start (Monday)
-    today = date.today()
-    week_start = today - timedelta(days=today.weekday())
+    week_start = leaderboard_service.current_week_start()
     week_start_dt = datetime.combine(week_start, datetime.min.time())
-    
-    # Get all users with their weekly stats
-    users_query = db.query(User).all()
-    
-    entries = []
-    for user in users_query:
-        # Calculate weekly points
-        weekly_points = db.query(func.sum(PointsLedger.points)).filter(
-            PointsLedger.user_id == user.id,
-            PointsLedger.earned_at >= week_start_dt
-        ).scalar() or 0
-        
-        # Calculate quiz accuracy for this week
-        quiz_attempts = db.query(QuizAttempt).filter(
-            QuizAttempt.user_id == user.id,
-            QuizAttempt.completed_at >= week_start_dt
-        ).all()
-        
-        total_score = sum(a.score for a in quiz_attempts)
-        max_score = sum(a.max_score for a in quiz_attempts)
-        quiz_accuracy = (total_score / max_score * 100) if max_score > 0 else None
-        
-        # Get weekly reading stats
-        reading_points = db.query(PointsLedger).filter(
-            PointsLedger.user_id == user.id,
-            PointsLedger.action_type == "read_article",
-            PointsLedger.earned_at >= week_start_dt
-        ).count()
-        
-        entries.append({
-            "user_id": user.id,
-            "display_name": user.display_name,
-            "weekly_points": weekly_points,
-            "quiz_accuracy": round(quiz_accuracy, 1) if quiz_accuracy else None,
-            "reading_time_minutes": (user.total_reading_time_seconds or 0) // 60,
-            "articles_read": reading_points
-        })
-    
-    # Sort by weekly points (primary) and quiz accuracy (secondary)
-    entries.sort(key=lambda x: (x["weekly_points"], x["quiz_accuracy"] or 0), reverse=True)
-    
-    # Add ranks
+
+    # Serve from the materialized cache; populate it on a cold start
+    # so the first request after boot still gets a leaderboard
+    cache_stmt = select(LeaderboardCache, User.display_name).join(
+        User, User.id == LeaderboardCache.user_id
+    ).where(
+        LeaderboardCache.week_start == week_start
+    ).order_by(LeaderboardCache.rank).limit(100)
+
+    cached = (await db.execute(cache_stmt)).all()
+
+    if not cached:
+        await leaderboard_service.refresh_leaderboard_cache(db)
+        cached = (await db.execute(cache_stmt)).all()
+
     leaderboard_entries = []
     user_rank = None
-    for rank, entry in enumerate(entries[:100], 1):
+    for entry, display_name in cached:
         leaderboard_entries.append(LeaderboardEntry(
-            rank=rank,
-            user_id=entry["user_id"],
-            display_name=entry["display_name"],
-            weekly_points=entry["weekly_points"],
-            quiz_accuracy=entry["quiz_accuracy"],
-            reading_time_minutes=entry["reading_time_minutes"],
-            articles_read=entry["articles_read"]
+            rank=entry.rank,
+            user_id=entry.user_id,
+            display_name=display_name,
+            weekly_points=entry.weekly_points,
+            quiz_accuracy=entry.quiz_accuracy,
+            reading_time_minutes=entry.reading_time_minutes,
+            articles_read=entry.articles_read
         ))
-        if str(entry["user_id"]) == user_id:
-            user_rank = rank
-    
+        if entry.user_id == user_id:
+            user_rank = entry.rank
+
     return LeaderboardResponse(
         entries=leaderboard_entries,
         week_start=week_start_dt,
@@ -193,18 +183,22 @@ async def get_leaderboard(
 
 @router.get("/quiz/weekly", response_model=QuizResponse)
 async def get_weekly_quiz(
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get the current weekly quiz."""
     today = date.today()
     week_start = today - timedelta(days=today.weekday())
     week_end = week_start + timedelta(days=6)
-    
-    quiz = db.query(WeeklyQuiz).filter(
-        WeeklyQuiz.week_start == week_start,
-        WeeklyQuiz.is_active == True
-    ).first()
-    
+
+    quiz = (await db.execute(
+        select(WeeklyQuiz)
+        .where(
+            WeeklyQuiz.week_start == week_start,
+            WeeklyQuiz.is_active == True
+        )
+        .options(selectinload(WeeklyQuiz.questions))
+    )).scalars().first()
+
     if not quiz:
         # Create new quiz if none exists
         quiz = WeeklyQuiz(
@@ -213,47 +207,59 @@ async def get_weekly_quiz(
             is_active=True
         )
         db.add(quiz)
-        db.commit()
-        db.refresh(quiz)
-        
+        await db.commit()
+        await db.refresh(quiz)
+
         # Generate questions from recent articles
-        recent_articles = db.query(Article).order_by(
-            Article.ingested_at.desc()
-        ).limit(5).all()
-        
-        for article in recent_articles:
-            try:
-                questions = await gemini_service.generate_quiz_questions(
-                    article.content, 
-                    num_questions=2
-                )
-                for q in questions:
-                    question = QuizQuestion(
-                        quiz_id=quiz.id,
-                        article_id=article.id,
-                        question=q.get("question", ""),
-                        options=q.get("options", []),
-                        correct_answer=q.get("correct_answer", ""),
-                        points_value=20
-                    )
-                    db.add(question)
-            except Exception:
+        recent_articles = (await db.execute(
+            select(Article)
+            .options(undefer(Article.content))
+            .order_by(Article.ingested_at.desc())
+            .limit(5)
+        )).scalars().all()
+
+        # Generate questions for all articles concurrently; one failed
+        # Gemini call doesn't block the rest
+        results = await asyncio.gather(*[
+            gemini_service.generate_quiz_questions(article.content, num_questions=2)
+            for article in recent_articles
+        ], return_exceptions=True)
+
+        quiz_questions = []
+        for article, questions in zip(recent_articles, results):
+            if isinstance(questions, Exception):
                 continue
-        
-        db.commit()
-        db.refresh(quiz)
-    
+            for q in questions:
+                quiz_questions.append(QuizQuestion(
+                    quiz_id=quiz.id,
+                    article_id=article.id,
+                    question=q.get("question", ""),
+                    options=q.get("options", []),
+                    correct_answer=q.get("correct_answer", ""),
+                    points_value=20
+                ))
+
+        db.add_all(quiz_questions)
+        await db.commit()
+
+        # Reload with questions for serialization
+        quiz = (await db.execute(
+            select(WeeklyQuiz)
+            .where(WeeklyQuiz.id == quiz.id)
+            .options(selectinload(WeeklyQuiz.questions))
+        )).scalar_one()
+
     return quiz
 
 
 @router.post("/quiz/generate")
 async def generate_quiz_from_verified_news(
     num_questions: int = 3,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Generate a quiz using Gemini 2.0 Flash from the week's highest-scored verified news.
-    
+
     This endpoint:
     - Finds articles with high veracity scores (70+)
     - Uses Gemini to create multiple-choice questions
@@ -262,45 +268,52 @@ async def generate_quiz_from_verified_news(
     today = date.today()
     week_start = today - timedelta(days=today.weekday())
     week_start_dt = datetime.combine(week_start, datetime.min.time())
-    
+
     # Get highest-scored verified articles from this week
-    verified_articles = db.query(Article).filter(
-        Article.ingested_at >= week_start_dt,
-        Article.veracity_score >= 70  # Only verified news
-    ).order_by(
-        Article.veracity_score.desc()
-    ).limit(3).all()
-    
+    verified_articles = (await db.execute(
+        select(Article)
+        .where(
+            Article.ingested_at >= week_start_dt,
+            Article.veracity_score >= 70  # Only verified news
+        )
+        .options(undefer(Article.content))
+        .order_by(Article.veracity_score.desc())
+        .limit(3)
+    )).scalars().all()
+
     if not verified_articles:
         # Fallback to any recent articles if no verified ones
-        verified_articles = db.query(Article).filter(
-            Article.ingested_at >= week_start_dt
-        ).order_by(
-            Article.ingested_at.desc()
-        ).limit(3).all()
-    
+        verified_articles = (await db.execute(
+            select(Article)
+            .where(Article.ingested_at >= week_start_dt)
+            .options(undefer(Article.content))
+            .order_by(Article.ingested_at.desc())
+            .limit(3)
+        )).scalars().all()
+
     if not verified_articles:
         raise HTTPException(
             status_code=404,
             detail="No articles available for quiz generation"
         )
-    
-    # Generate questions from articles
+
+    # Generate questions from all articles concurrently
+    per_article = num_questions // len(verified_articles) or 1
+    results = await asyncio.gather(*[
+        gemini_service.generate_quiz_questions(article.content, num_questions=per_article)
+        for article in verified_articles
+    ], return_exceptions=True)
+
     all_questions = []
-    for article in verified_articles:
-        try:
-            questions = await gemini_service.generate_quiz_questions(
-                article.content,
-                num_questions=num_questions // len(verified_articles) or 1
-            )
-            for q in questions:
-                q["article_id"] = str(article.id)
-                q["article_title"] = article.title
-                q["veracity_score"] = article.veracity_score
-            all_questions.extend(questions)
-        except Exception as e:
+    for article, questions in zip(verified_articles, results):
+        if isinstance(questions, Exception):
             continue
-    
+        for q in questions:
+            q["article_id"] = str(article.id)
+            q["article_title"] = article.title
+            q["veracity_score"] = article.veracity_score
+        all_questions.extend(questions)
+
     return {
         "questions": all_questions[:num_questions],
         "source_articles": [
@@ -317,8 +330,8 @@ async def generate_quiz_from_verified_news(
 @router.post("/quiz/submit", response_model=QuizResultResponse)
 async def submit_quiz(
     submission: QuizSubmit,
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Submit quiz answers."""
     if not submission.answers:
@@ -326,19 +339,23 @@ async def submit_quiz(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No answers provided"
         )
-    
-    # Get quiz from first question
-    first_question = db.query(QuizQuestion).filter(
-        QuizQuestion.id == submission.answers[0].question_id
-    ).first()
-    
+
+    # Fetch every submitted question in one IN query
+    question_ids = [a.question_id for a in submission.answers]
+    questions = {
+        q.id: q for q in (await db.execute(
+            select(QuizQuestion).where(QuizQuestion.id.in_(question_ids))
+        )).scalars().all()
+    }
+
+    first_question = questions.get(question_ids[0])
     if not first_question:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Question not found"
         )
-    
-    # Create attempt
+
+    # Create attempt; flush (not commit) to assign its id for the answers
     attempt = QuizAttempt(
         user_id=user_id,
         quiz_id=first_question.quiz_id,
@@ -346,39 +363,38 @@ async def submit_quiz(
         max_score=0
     )
     db.add(attempt)
-    db.commit()
-    db.refresh(attempt)
-    
-    # Process answers
+    await db.flush()
+
+    # Grade answers in Python against the pre-fetched questions
     correct_count = 0
     total_points = 0
-    
+    max_score = 0
+    answers = []
+
     for answer_data in submission.answers:
-        question = db.query(QuizQuestion).filter(
-            QuizQuestion.id == answer_data.question_id
-        ).first()
-        
+        question = questions.get(answer_data.question_id)
         if not question:
             continue
-        
+
         is_correct = answer_data.selected_answer == question.correct_answer
         if is_correct:
             correct_count += 1
             total_points += question.points_value
-        
-        answer = QuizAnswer(
+        max_score += question.points_value
+
+        answers.append(QuizAnswer(
             attempt_id=attempt.id,
             question_id=question.id,
             selected_answer=answer_data.selected_answer,
             is_correct=is_correct
-        )
-        db.add(answer)
-        attempt.max_score += question.points_value
-    
+        ))
+
+    db.add_all(answers)
     attempt.score = total_points
-    db.commit()
-    
-    # Award points
+    attempt.max_score = max_score
+    attempt.completed_at = datetime.now(timezone.utc)
+
+    # Award points in the same transaction
     if total_points > 0:
         points_entry = PointsLedger(
             user_id=user_id,
@@ -387,8 +403,9 @@ async def submit_quiz(
             reference_id=attempt.id
         )
         db.add(points_entry)
-        db.commit()
-    
+
+    await db.commit()
+
     return QuizResultResponse(
         score=total_points,
         max_score=attempt.max_score,
@@ -1,83 +1,163 @@
+import asyncio
+import base64
+import logging
 from typing import Optional, List
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query
+from sqlalchemy import select, tuple_
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import selectinload, joinedload, undefer
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timezone
 
-from app.db import get_db, Article, ArticleSummary, ArticleJargon, TasteProfile
+from app.db import get_db, AsyncSessionLocal, Article, ArticleSummary, ArticleJargon
+from app.api.user import get_cached_taste_profile
+from app.core.cache import redis_cache
 from app.core.security import get_current_user_id, get_optional_user_id
 from app.schemas import (
     ArticleCreate, ArticleResponse, ArticleListResponse,
-    ArticleSummaryResponse
+    ArticleListAdapter, ArticleSummaryResponse
 )
 from app.services import gemini_service, news_api_service
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/api/news", tags=["News"])
 
+# Background refresh cadence and fallback categories for anonymous users
+NEWS_REFRESH_INTERVAL_SECONDS = 900
+DEFAULT_CATEGORIES = ["technology", "science", "business"]
+
+
+async def refresh_news_in_background(categories: List[str]) -> None:
+    """Run a NewsAPI refresh with its own session, swallowing failures.
+
+    Used from BackgroundTasks and the periodic loop, where the
+    request-scoped session is no longer available.
+    """
+    try:
+        async with AsyncSessionLocal() as session:
+            await refresh_news_from_api(categories=categories, db=session)
+    except Exception as e:
+        logger.warning(f"Background news refresh failed: {e}")
+
+
+async def news_refresh_loop():
+    """Periodically pull fresh headlines so requests never have to."""
+    while True:
+        await refresh_news_in_background(DEFAULT_CATEGORIES)
+        await asyncio.sleep(NEWS_REFRESH_INTERVAL_SECONDS)
+
+
+def _encode_cursor(ingested_at: datetime, article_id: str) -> str:
+    """Encode an (ingested_at, id) keyset position as an opaque cursor."""
+    raw = f"{ingested_at.isoformat()}|{article_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple:
+    """Decode a cursor back to (ingested_at, id), or raise 400."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        ts_raw, _, article_id = raw.partition("|")
+        return datetime.fromisoformat(ts_raw), UUID(article_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+
 
 @router.get("", response_model=ArticleListResponse)
 async def list_articles(
-    page: int = Query(1, ge=1),
+    background_tasks: BackgroundTasks,
+    cursor: Optional[str] = Query(None, description="Opaque cursor from a previous page"),
     page_size: int = Query(20, ge=1, le=100),
     category: Optional[str] = None,
-    user_id: Optional[str] = Depends(get_optional_user_id),
-    db: Session = Depends(get_db)
+    user_id: Optional[UUID] = Depends(get_optional_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Get paginated list of articles.
-    
+    Get a keyset-paginated list of articles.
+
     If user is authenticated, filters by their preferred categories.
-    Fetches live news if database is empty.
+    Schedules a background fetch if the database is empty.
     """
-    query = db.query(Article)
-    
-    # Get user's preferred categories if authenticated
+    # Get user's preferred categories if authenticated (Redis-backed)
     preferred_categories = []
     if user_id:
-        taste_profile = db.query(TasteProfile).filter(
-            TasteProfile.user_id == user_id
-        ).first()
+        taste_profile = await get_cached_taste_profile(user_id, db)
         if taste_profile and taste_profile.preferred_categories:
             preferred_categories = taste_profile.preferred_categories
-    
+
+    # Serve from Redis when an identical page was rendered recently;
+    # entries are invalidated whenever new articles are ingested
+    cache_key = (
+        f"news:{category}:{cursor}:{page_size}:"
+        f"{','.join(sorted(preferred_categories))}"
+    )
+    cached = await redis_cache.get(cache_key)
+    if cached:
+        return ArticleListResponse.model_validate_json(cached)
+
     # Filter by specific category if provided
+    filters = []
     if category:
-        query = query.filter(Article.category == category)
-    elif preferred_categories and not category:
+        filters.append(Article.category == category)
+    elif preferred_categories:
         # Filter by user's preferred categories
-        query = query.filter(Article.category.in_(preferred_categories))
-    
-    total = query.count()
-    
-    # If no articles in database, try to fetch from NewsAPI
-    if total == 0:
-        await refresh_news_from_api(
-            categories=preferred_categories or ["technology", "science", "business"],
-            db=db
+        filters.append(Article.category.in_(preferred_categories))
+
+    # Keyset pagination: seek past the cursor position instead of
+    # scanning OFFSET rows, so deep pages cost the same as page one
+    if cursor:
+        cursor_ts, cursor_id = _decode_cursor(cursor)
+        filters.append(
+            tuple_(Article.ingested_at, Article.id) < (cursor_ts, cursor_id)
         )
-        total = query.count()
-    
-    articles = query.order_by(Article.ingested_at.desc()) \
-        .offset((page - 1) * page_size) \
-        .limit(page_size) \
-        .all()
-    
-    return ArticleListResponse(
-        items=articles,
-        total=total,
-        page=page,
-        page_size=page_size
+
+    page_stmt = (
+        select(Article)
+        .where(*filters)
+        .options(selectinload(Article.summaries), selectinload(Article.jargon))
+        .order_by(Article.ingested_at.desc(), Article.id.desc())
+        .limit(page_size + 1)
+    )
+    fetched = (await db.execute(page_stmt)).scalars().all()
+
+    # If no articles in database, kick off a fetch after responding —
+    # the cold request returns an empty page instead of waiting on NewsAPI
+    if not fetched and cursor is None:
+        background_tasks.add_task(
+            refresh_news_in_background,
+            preferred_categories or DEFAULT_CATEGORIES
+        )
+
+    articles = fetched[:page_size]
+    next_cursor = None
+    if len(fetched) > page_size and articles:
+        last = articles[-1]
+        next_cursor = _encode_cursor(last.ingested_at, str(last.id))
+
+    response = ArticleListResponse(
+        items=ArticleListAdapter.validate_python(articles),
+        page_size=page_size,
+        next_cursor=next_cursor
     )
+    await redis_cache.setex(cache_key, 60, response.model_dump_json())
+    return response
 
 
 @router.get("/refresh")
 async def refresh_articles(
     categories: Optional[str] = Query(None, description="Comma-separated categories"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Manually refresh articles from NewsAPI.
-    
+
     Categories: technology, science, business, health, sports, entertainment
     """
     category_list = categories.split(",") if categories else ["technology", "science", "business"]
@@ -85,36 +165,49 @@ async def refresh_articles(
     return {"message": f"Fetched {count} new articles", "categories": category_list}
 
 
-async def refresh_news_from_api(categories: List[str], db: Session) -> int:
+async def refresh_news_from_api(categories: List[str], db: AsyncSession) -> int:
     """Fetch news from NewsAPI and store in database."""
-    articles_fetched = 0
-    
-    for category in categories:
-        news_items = await news_api_service.fetch_top_headlines(
-            category=category,
-            page_size=20
-        )
-        
+    # Fetch all categories concurrently; wall clock is the slowest
+    # provider call instead of the sum of them
+    results = await asyncio.gather(*[
+        news_api_service.fetch_top_headlines(category=category, page_size=20)
+        for category in categories
+    ])
+
+    # Collect one row per unique source URL across all categories
+    rows = {}
+    for category, news_items in zip(categories, results):
         for item in news_items:
-            # Check if article already exists (by source URL)
-            existing = db.query(Article).filter(
-                Article.source_url == item.get("source_url")
-            ).first()
-            
-            if not existing and item.get("content"):
-                article = Article(
-                    title=item.get("title", "Untitled"),
-                    content=item.get("content", ""),
-                    source_url=item.get("source_url", ""),
-                    category=item.get("category", category.capitalize()),
-                    published_at=datetime.fromisoformat(
-                        item.get("published_at", "").replace("Z", "+00:00")
-                    ) if item.get("published_at") else datetime.utcnow(),
-                )
-                db.add(article)
-                articles_fetched += 1
-    
-    db.commit()
+            source_url = item.get("source_url", "")
+            if not item.get("content") or source_url in rows:
+                continue
+            rows[source_url] = {
+                "title": item.get("title", "Untitled"),
+                "content": item.get("content", ""),
+                "source_url": source_url,
+                "category": item.get("category", category.capitalize()),
+                "published_at": datetime.fromisoformat(
+                    item.get("published_at", "").replace("Z", "+00:00")
+                ) if item.get("published_at") else datetime.now(timezone.utc),
+            }
+
+    if not rows:
+        return 0
+
+    # One bulk insert; the unique index on source_url dedups against
+    # existing articles without a SELECT per item
+    insert_fn = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = insert_fn(Article).values(list(rows.values())).on_conflict_do_nothing(
+        index_elements=["source_url"]
+    )
+    result = await db.execute(stmt)
+    articles_fetched = result.rowcount or 0
+    await db.commit()
+
+    # Cached list pages are stale once new articles land
+    if articles_fetched:
+        await redis_cache.clear_namespace("news:")
+
     return articles_fetched
 
 
@@ -137,17 +230,27 @@ async def get_available_categories():
 @router.get("/{article_id}", response_model=ArticleResponse)
 async def get_article(
     article_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get a single article by ID."""
-    article = db.query(Article).filter(Article.id == article_id).first()
-    
+    # Single-object fetch: one JOIN query instead of the extra
+    # per-collection SELECTs selectinload would issue
+    article = (await db.execute(
+        select(Article)
+        .where(Article.id == article_id)
+        .options(
+            undefer(Article.content),
+            joinedload(Article.summaries),
+            joinedload(Article.jargon),
+        )
+    )).unique().scalar_one_or_none()
+
     if not article:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found"
         )
-    
+
     return article
 
 
@@ -155,47 +258,75 @@ async def get_article(
 async def get_article_summary(
     article_id: UUID,
     mode: str = Query("pro", pattern="^(kid|pro)$"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Get or generate article summary."""
-    article = db.query(Article).filter(Article.id == article_id).first()
-    
+    # L1: Redis, in front of the DB cache — articles are immutable so
+    # a generated summary can be served for a long TTL
+    summary_key = f"summary:{article_id}:{mode}"
+    cached = await redis_cache.get(summary_key)
+    if cached:
+        return ArticleSummaryResponse.model_validate_json(cached)
+
+    article = (await db.execute(
+        select(Article)
+        .where(Article.id == article_id)
+        .options(undefer(Article.content))
+    )).scalar_one_or_none()
+
     if not article:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found"
         )
-    
-    # Check for cached summary
-    existing_summary = db.query(ArticleSummary).filter(
-        ArticleSummary.article_id == article_id,
-        ArticleSummary.mode == mode
-    ).first()
-    
+
+    # L2: check for cached summary in the database
+    existing_summary = (await db.execute(
+        select(ArticleSummary).where(
+            ArticleSummary.article_id == article_id,
+            ArticleSummary.mode == mode
+        )
+    )).scalar_one_or_none()
+
     if existing_summary:
-        return existing_summary
-    
+        response = ArticleSummaryResponse.model_validate(existing_summary)
+        await redis_cache.setex(summary_key, 86400, response.model_dump_json())
+        return response
+
     # Generate new summary
     summary_text = await gemini_service.generate_summary(article.content, mode)
-    
-    # Cache the summary
-    new_summary = ArticleSummary(
-        article_id=article_id,
-        mode=mode,
-        summary=summary_text
+
+    # Upsert on the (article_id, mode) unique constraint: concurrent
+    # requests for a fresh article all generate, but the losers update
+    # the winner's row instead of dying on IntegrityError
+    insert_fn = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = insert_fn(ArticleSummary).values(
+        article_id=article_id, mode=mode, summary=summary_text
     )
-    db.add(new_summary)
-    db.commit()
-    db.refresh(new_summary)
-    
-    return new_summary
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["article_id", "mode"],
+        set_={"summary": stmt.excluded.summary},
+    )
+    await db.execute(stmt)
+    await db.commit()
+
+    new_summary = (await db.execute(
+        select(ArticleSummary).where(
+            ArticleSummary.article_id == article_id,
+            ArticleSummary.mode == mode
+        )
+    )).scalar_one()
+
+    response = ArticleSummaryResponse.model_validate(new_summary)
+    await redis_cache.setex(summary_key, 86400, response.model_dump_json())
+    return response
 
 
 @router.post("", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
 async def create_article(
     article_data: ArticleCreate,
-    db: Session = Depends(get_db),
-    user_id: str = Depends(get_current_user_id)
+    db: AsyncSession = Depends(get_db),
+    user_id: UUID = Depends(get_current_user_id)
 ):
     """Create a new article (admin only)."""
     article = Article(
@@ -206,9 +337,17 @@ async def create_article(
         published_at=article_data.published_at
     )
     db.add(article)
-    db.commit()
-    db.refresh(article)
-    
+    try:
+        await db.commit()
+    except IntegrityError:
+        # source_url is unique; a duplicate POST is a conflict, not a 500
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="An article with this source_url already exists"
+        )
+    await db.refresh(article)
+
     # Extract jargon asynchronously
     try:
         jargon_items = await gemini_service.extract_jargon(article.content)
@@ -220,9 +359,18 @@ async def create_article(
                 difficulty=item.get("difficulty", "intermediate")
             )
             db.add(jargon)
-        db.commit()
+        await db.commit()
     except Exception:
         pass  # Don't fail if AI extraction fails
-    
-    db.refresh(article)
+
+    # Reload with relations for serialization
+    article = (await db.execute(
+        select(Article)
+        .where(Article.id == article.id)
+        .options(
+            undefer(Article.content),
+            joinedload(Article.summaries),
+            joinedload(Article.jargon),
+        )
+    )).unique().scalar_one()
     return article
@@ -1,45 +1,85 @@
+from typing import Optional
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db import get_db, User, TasteProfile
+from app.core.cache import redis_cache
 from app.core.security import get_current_user_id
 from app.schemas import TasteProfileUpdate, TasteProfileResponse, UserResponse
 
 router = APIRouter(prefix="/api/user", tags=["User"])
 
+# Taste profiles change rarely but are read on every personalized
+# request, so a short Redis TTL removes most of the lookups
+TASTE_CACHE_TTL_SECONDS = 300
+
+
+def taste_cache_key(user_id: UUID) -> str:
+    return f"taste:{user_id}"
+
+
+async def get_cached_taste_profile(
+    user_id: UUID, db: AsyncSession
+) -> Optional[TasteProfileResponse]:
+    """Fetch a user's taste profile via Redis, falling back to the DB.
+
+    Writers (update_profile, complete_profile) delete the key after
+    commit, so stale reads are bounded by the TTL only if Redis misses
+    the invalidation.
+    """
+    key = taste_cache_key(user_id)
+    cached = await redis_cache.get(key)
+    if cached:
+        return TasteProfileResponse.model_validate_json(cached)
+
+    profile = (await db.execute(
+        select(TasteProfile).where(TasteProfile.user_id == user_id)
+    )).scalar_one_or_none()
+    if not profile:
+        return None
+
+    response = TasteProfileResponse.model_validate(profile)
+    await redis_cache.setex(key, TASTE_CACHE_TTL_SECONDS, response.model_dump_json())
+    return response
+
 
 @router.get("/profile", response_model=TasteProfileResponse)
 async def get_profile(
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Get current user's taste profile."""
-    profile = db.query(TasteProfile).filter(TasteProfile.user_id == user_id).first()
-    
+    profile = await get_cached_taste_profile(user_id, db)
+
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
-    
+
     return profile
 
 
 @router.put("/profile", response_model=TasteProfileResponse)
 async def update_profile(
     profile_data: TasteProfileUpdate,
-    user_id: str = Depends(get_current_user_id),
-    db: Session = Depends(get_db)
+    user_id: UUID = Depends(get_current_user_id),
+    db: AsyncSession = Depends(get_db)
 ):
     """Update current user's taste profile."""
-    profile = db.query(TasteProfile).filter(TasteProfile.user_id == user_id).first()
-    
+    profile = (await db.execute(
+        select(TasteProfile).where(TasteProfile.user_id == user_id)
+    )).scalar_one_or_none()
+
     if not profile:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found"
         )
-    
+
     # Update only provided fields
     if profile_data.preferred_categories is not None:
         profile.preferred_categories = profile_data.preferred_categories
@@ -49,8 +89,11 @@ async def update_profile(
         profile.reading_level = profile_data.reading_level
     if profile_data.topic_weights is not None:
         profile.topic_weights = profile_data.topic_weights
-    
-    db.commit()
-    db.refresh(profile)
-    
+
+    await db.commit()
+    await db.refresh(profile)
+
+    # Invalidate the cached copy so reads see the new preferences
+    await redis_cache.delete(taste_cache_key(user_id))
+
     return profile
@@ -0,0 +1,88 @@
+"""
+Redis Cache
+
+Thin async Redis wrapper used for response caching and other hot-path
+lookups. Every operation degrades to a cache miss when Redis is
+unreachable, so the API keeps working without it (e.g. local
+development without a Redis container).
+"""
+
+import logging
+from typing import Optional
+
+import redis.asyncio as aioredis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache:
+    """Async Redis client with fail-open semantics."""
+
+    def __init__(self):
+        self._client: Optional[aioredis.Redis] = None
+
+    def _get_client(self) -> aioredis.Redis:
+        if self._client is None:
+            self._client = aioredis.from_url(
+                settings.redis_url,
+                encoding="utf-8",
+                decode_responses=True,
+            )
+        return self._client
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a cached value, or None on miss or Redis failure."""
+        try:
+            return await self._get_client().get(key)
+        except Exception as e:
+            logger.debug(f"Redis GET failed for {key}: {e}")
+            return None
+
+    async def setex(self, key: str, ttl_seconds: int, value: str) -> None:
+        """Set a value with expiry; silently skipped on Redis failure."""
+        try:
+            await self._get_client().setex(key, ttl_seconds, value)
+        except Exception as e:
+            logger.debug(f"Redis SETEX failed for {key}: {e}")
+
+    async def delete(self, *keys: str) -> None:
+        """Delete keys; silently skipped on Redis failure."""
+        if not keys:
+            return
+        try:
+            await self._get_client().delete(*keys)
+        except Exception as e:
+            logger.debug(f"Redis DELETE failed: {e}")
+
+    async def exists(self, key: str) -> bool:
+        """Check key existence; False on Redis failure."""
+        try:
+            return bool(await self._get_client().exists(key))
+        except Exception as e:
+            logger.debug(f"Redis EXISTS failed for {key}: {e}")
+            return False
+
+    async def clear_namespace(self, prefix: str) -> None:
+        """Delete all keys under a prefix (e.g. 'news:')."""
+        try:
+            client = self._get_client()
+            keys = [key async for key in client.scan_iter(match=f"{prefix}*")]
+            if keys:
+                await client.delete(*keys)
+        except Exception as e:
+            logger.debug(f"Redis namespace clear failed for {prefix}: {e}")
+
+    async def close(self) -> None:
+        """Close the underlying connection pool."""
+        if self._client:
+            try:
+                await self._client.aclose()
+            except Exception:
+                pass
+            self._client = None
+
+
+# Singleton instance
+redis_cache = RedisCache()
@@ -11,6 +11,14 @@ class Settings(BaseSettings):
     
     # Kafka
     kafka_bootstrap_servers: str = "kafka:29092"
+    consumer_batch_size: int = 50
+    consumer_batch_timeout_ms: int = 1000
+    # Run the AI consumer inside the API process (single-process dev
+    # convenience); in production run app.consumer_runner replicas
+    run_consumer_in_process: bool = False
+
+    # Redis
+    redis_url: str = "redis://redis:6379/0"
     
     # Gemini AI
     gemini_api_key: Optional[str] = None
@@ -43,3 +51,9 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+# Module-level singleton: import this directly instead of calling
+# get_settings() on hot paths (skips the lru_cache lock/lookup).
+# get_settings() stays for dependency overrides in tests.
+settings = get_settings()
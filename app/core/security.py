@@ -1,3 +1,5 @@
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
@@ -5,9 +7,9 @@ from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
-from app.core.config import get_settings
+from app.core.cache import redis_cache
+from app.core.config import settings
 
-settings = get_settings()
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -35,7 +37,8 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
     
-    to_encode.update({"exp": expire})
+    # jti identifies this token so logout can revoke it individually
+    to_encode.update({"exp": expire, "jti": str(uuid.uuid4())})
     encoded_jwt = jwt.encode(
         to_encode,
         settings.jwt_secret_key,
@@ -57,37 +60,84 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
-async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> str:
+async def get_current_user_id(token: str = Depends(oauth2_scheme)) -> uuid.UUID:
     """Extract user ID from JWT token."""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
     payload = decode_access_token(token)
     if payload is None:
         raise credentials_exception
-    
-    user_id: str = payload.get("sub")
-    if user_id is None:
+
+    sub = payload.get("sub")
+    if sub is None:
         raise credentials_exception
-    
+
+    # Coerce once here: the Uuid columns don't accept raw strings on
+    # non-native backends (SQLite), so queries always get a UUID
+    try:
+        user_id = uuid.UUID(sub)
+    except ValueError:
+        raise credentials_exception
+
+    # Reject tokens revoked via /logout; keys expire with the token
+    jti = payload.get("jti")
+    if jti and await redis_cache.exists(f"auth:revoked:{jti}"):
+        raise credentials_exception
+
     return user_id
 
 
+async def revoke_token(token: str) -> bool:
+    """Blacklist a token's jti in Redis until its natural expiry."""
+    payload = decode_access_token(token)
+    if payload is None:
+        return False
+
+    jti = payload.get("jti")
+    exp = payload.get("exp")
+    if not jti or not exp:
+        return False
+
+    # exp is an epoch timestamp; compare against the epoch clock (a
+    # naive datetime's .timestamp() would be read in local time)
+    ttl_seconds = int(exp - time.time())
+    if ttl_seconds > 0:
+        await redis_cache.setex(f"auth:revoked:{jti}", ttl_seconds, "1")
+    return True
+
+
 # Optional OAuth2 scheme (doesn't require token)
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
 
-async def get_optional_user_id(token: Optional[str] = Depends(oauth2_scheme_optional)) -> Optional[str]:
+async def get_optional_user_id(
+    token: Optional[str] = Depends(oauth2_scheme_optional)
+) -> Optional[uuid.UUID]:
     """Extract user ID from JWT token, or return None if not authenticated."""
     if not token:
         return None
-    
+
     payload = decode_access_token(token)
     if payload is None:
         return None
-    
-    return payload.get("sub")
+
+    sub = payload.get("sub")
+    if sub is None:
+        return None
+
+    try:
+        user_id = uuid.UUID(sub)
+    except ValueError:
+        return None
+
+    # A revoked token must not personalize responses either
+    jti = payload.get("jti")
+    if jti and await redis_cache.exists(f"auth:revoked:{jti}"):
+        return None
+
+    return user_id
 
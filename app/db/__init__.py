@@ -1,5 +1,8 @@
 # Database module
-from app.db.session import Base, engine, get_db, SessionLocal
+from app.db.session import (
+    Base, engine, get_db, SessionLocal,
+    async_engine, AsyncSessionLocal
+)
 from app.db.models import (
     User, TasteProfile, Article, ArticleSummary, ArticleJargon,
     PointsLedger, WeeklyQuiz, QuizQuestion, QuizAttempt, QuizAnswer,
@@ -8,6 +11,7 @@ from app.db.models import (
 
 __all__ = [
     "Base", "engine", "get_db", "SessionLocal",
+    "async_engine", "AsyncSessionLocal",
     "User", "TasteProfile", "Article", "ArticleSummary", "ArticleJargon",
     "PointsLedger", "WeeklyQuiz", "QuizQuestion", "QuizAttempt", "QuizAnswer",
     "LeaderboardCache"
@@ -1,19 +1,19 @@
 import uuid
-from datetime import datetime
-from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, JSON, Date, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, Integer, Boolean, DateTime, ForeignKey, JSON, Date, Float, Index, Uuid, UniqueConstraint, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, deferred
 from app.db.session import Base
 
-
-def generate_uuid():
-    return str(uuid.uuid4())
+# jsonb on PostgreSQL (binary, indexable, no re-parse on read);
+# plain JSON elsewhere so SQLite dev databases keep working
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
 
 
 class User(Base):
     """User model for authentication and profile."""
     __tablename__ = "users"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     email = Column(String(255), unique=True, nullable=False, index=True)
     password_hash = Column(String(255), nullable=True)  # Nullable for OAuth users
     display_name = Column(String(100), nullable=True)  # Set during profile completion
@@ -24,172 +24,230 @@ class User(Base):
     avatar_url = Column(String(1000), nullable=True)
     profile_complete = Column(Boolean, default=False)  # True after user completes registration
     
-    created_at = Column(DateTime, default=datetime.utcnow)
-    last_login = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_login = Column(DateTime(timezone=True), nullable=True)
     total_reading_time_seconds = Column(Integer, default=0)  # Cumulative reading time
     articles_read_count = Column(Integer, default=0)  # Total articles read
     
     # Relationships
-    taste_profile = relationship("TasteProfile", back_populates="user", uselist=False)
-    points = relationship("PointsLedger", back_populates="user")
-    quiz_attempts = relationship("QuizAttempt", back_populates="user")
+    taste_profile = relationship("TasteProfile", back_populates="user", uselist=False, lazy="raise")
+    points = relationship("PointsLedger", back_populates="user", lazy="raise")
+    quiz_attempts = relationship("QuizAttempt", back_populates="user", lazy="raise")
 
 
 class TasteProfile(Base):
     """User taste profile for personalization."""
     __tablename__ = "taste_profiles"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
-    preferred_categories = Column(JSON, default=list)  # ["tech", "science", "sports"]
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    preferred_categories = Column(JSONVariant, default=list)  # ["tech", "science", "sports"]
     summary_mode = Column(String(10), default="pro")  # "kid" or "pro"
     reading_level = Column(Integer, default=5)  # 1-10 scale
-    topic_weights = Column(JSON, default=dict)  # {"ai": 0.8, "crypto": 0.2}
+    topic_weights = Column(JSONVariant, default=dict)  # {"ai": 0.8, "crypto": 0.2}
     
     # Relationships
-    user = relationship("User", back_populates="taste_profile")
+    user = relationship("User", back_populates="taste_profile", lazy="raise")
+
+    __table_args__ = (
+        # GIN index for containment queries on preferred categories,
+        # e.g. preferred_categories @> '["tech"]' (PostgreSQL only)
+        Index(
+            "ix_taste_prefcats_gin",
+            preferred_categories,
+            postgresql_using="gin",
+        ),
+    )
 
 
 class Article(Base):
     """News article model."""
     __tablename__ = "articles"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     title = Column(String(500), nullable=False)
-    content = Column(Text, nullable=False)
-    source_url = Column(String(1000), nullable=True)
+    # Deferred: the full body is large and only needed by detail /
+    # generation paths, which opt in with undefer(Article.content)
+    content = deferred(Column(Text, nullable=False))
+    source_url = Column(String(1000), nullable=True, unique=True, index=True)
     source_name = Column(String(255), nullable=True)
     author = Column(String(255), nullable=True)
     category = Column(String(100), nullable=True, index=True)
     image_url = Column(String(1000), nullable=True)
-    published_at = Column(DateTime, nullable=True)
-    ingested_at = Column(DateTime, default=datetime.utcnow)
+    published_at = Column(DateTime(timezone=True), nullable=True)
+    ingested_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Fact checking
     veracity_score = Column(Float, nullable=True)  # 0-100 score
-    fact_check_claims = Column(JSON, default=list)  # List of claim reviews
+    fact_check_claims = Column(JSONVariant, default=list)  # List of claim reviews
     
     # Relationships
-    summaries = relationship("ArticleSummary", back_populates="article")
-    jargon = relationship("ArticleJargon", back_populates="article")
-    quiz_questions = relationship("QuizQuestion", back_populates="article")
+    summaries = relationship("ArticleSummary", back_populates="article", lazy="raise")
+    jargon = relationship("ArticleJargon", back_populates="article", lazy="raise")
+    quiz_questions = relationship("QuizQuestion", back_populates="article", lazy="raise")
+
+    __table_args__ = (
+        # Backs keyset pagination per category on the list endpoint
+        Index("idx_article_category_ingested", category, ingested_at.desc(), id.desc()),
+        # Backs "latest by category" ordered by publication date
+        Index("idx_article_category_published", category, published_at.desc()),
+    )
 
 
 class ArticleSummary(Base):
     """Cached article summaries for different modes."""
     __tablename__ = "article_summaries"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    article_id = Column(String(36), ForeignKey("articles.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    article_id = Column(Uuid, ForeignKey("articles.id"), nullable=False)
     mode = Column(String(10), nullable=False)  # "kid" or "pro"
     summary = Column(Text, nullable=False)
-    generated_at = Column(DateTime, default=datetime.utcnow)
+    generated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    article = relationship("Article", back_populates="summaries")
+    article = relationship("Article", back_populates="summaries", lazy="raise")
+
+    __table_args__ = (
+        # One summary per article/mode; also backs the summary lookup
+        UniqueConstraint("article_id", "mode", name="uq_summary_article_mode"),
+    )
 
 
 class ArticleJargon(Base):
     """Jargon terms extracted from articles."""
     __tablename__ = "article_jargon"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    article_id = Column(String(36), ForeignKey("articles.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    article_id = Column(Uuid, ForeignKey("articles.id"), nullable=False)
     term = Column(String(255), nullable=False)
     definition = Column(Text, nullable=False)
     difficulty = Column(String(20), default="medium")  # easy, medium, hard
     
     # Relationships
-    article = relationship("Article", back_populates="jargon")
+    article = relationship("Article", back_populates="jargon", lazy="raise")
 
 
 class PointsLedger(Base):
-    """Points earned by users for various actions."""
+    """Points earned by users for various actions.
+
+    Append-only; on PostgreSQL the table is range-partitioned by month
+    on earned_at so week-bounded queries scan only recent partitions
+    and old months can be detached for archival. Migration 0005 seeds
+    the partitions (earned_at is part of the primary key because
+    PostgreSQL requires the partition key in every unique constraint).
+    """
     __tablename__ = "points_ledger"
-    
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     points = Column(Integer, nullable=False)
     action_type = Column(String(50), nullable=False)  # "read_article", "quiz_correct", etc.
-    reference_id = Column(String(36), nullable=True)  # Article or quiz ID
-    earned_at = Column(DateTime, default=datetime.utcnow)
-    
+    reference_id = Column(Uuid, nullable=True)  # Article or quiz ID
+    earned_at = Column(DateTime(timezone=True), primary_key=True, server_default=func.now())
+
     # Relationships
-    user = relationship("User", back_populates="points")
+    user = relationship("User", back_populates="points", lazy="raise")
+
+    __table_args__ = (
+        # Backs the week-bounded SUM(points) aggregates
+        Index("idx_points_user_earned", user_id, earned_at.desc()),
+        # Partial index for the weekly articles-read count
+        Index(
+            "idx_points_user_action_earned",
+            user_id, action_type, earned_at,
+            postgresql_where=(action_type == "read_article"),
+            sqlite_where=(action_type == "read_article"),
+        ),
+        {"postgresql_partition_by": "RANGE (earned_at)"},
+    )
 
 
 class WeeklyQuiz(Base):
     """Weekly quiz generated from articles."""
     __tablename__ = "weekly_quizzes"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
     week_start = Column(Date, nullable=False, index=True)
     week_end = Column(Date, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    is_active = Column(Boolean, default=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
-    questions = relationship("QuizQuestion", back_populates="quiz")
-    attempts = relationship("QuizAttempt", back_populates="quiz")
+    questions = relationship("QuizQuestion", back_populates="quiz", lazy="raise")
+    attempts = relationship("QuizAttempt", back_populates="quiz", lazy="raise")
 
 
 class QuizQuestion(Base):
     """Individual quiz question."""
     __tablename__ = "quiz_questions"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    quiz_id = Column(String(36), ForeignKey("weekly_quizzes.id"), nullable=False)
-    article_id = Column(String(36), ForeignKey("articles.id"), nullable=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    quiz_id = Column(Uuid, ForeignKey("weekly_quizzes.id"), nullable=False)
+    article_id = Column(Uuid, ForeignKey("articles.id"), nullable=True)
     question = Column(Text, nullable=False)
-    options = Column(JSON, nullable=False)  # ["option1", "option2", "option3", "option4"]
+    options = Column(JSONVariant, nullable=False)  # ["option1", "option2", "option3", "option4"]
     correct_answer = Column(String(500), nullable=False)
     points_value = Column(Integer, default=20)
     
     # Relationships
-    quiz = relationship("WeeklyQuiz", back_populates="questions")
-    article = relationship("Article", back_populates="quiz_questions")
+    quiz = relationship("WeeklyQuiz", back_populates="questions", lazy="raise")
+    article = relationship("Article", back_populates="quiz_questions", lazy="raise")
 
 
 class QuizAttempt(Base):
     """User's attempt at a quiz."""
     __tablename__ = "quiz_attempts"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
-    quiz_id = Column(String(36), ForeignKey("weekly_quizzes.id"), nullable=False)
-    started_at = Column(DateTime, default=datetime.utcnow)
-    completed_at = Column(DateTime, nullable=True)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
+    quiz_id = Column(Uuid, ForeignKey("weekly_quizzes.id"), nullable=False)
+    started_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
     score = Column(Integer, default=0)
+    max_score = Column(Integer, default=0)
     
     # Relationships
-    user = relationship("User", back_populates="quiz_attempts")
-    quiz = relationship("WeeklyQuiz", back_populates="attempts")
-    answers = relationship("QuizAnswer", back_populates="attempt")
+    user = relationship("User", back_populates="quiz_attempts", lazy="raise")
+    quiz = relationship("WeeklyQuiz", back_populates="attempts", lazy="raise")
+    answers = relationship("QuizAnswer", back_populates="attempt", lazy="raise")
+
+    __table_args__ = (
+        # Backs the weekly quiz accuracy aggregate
+        Index("idx_quiz_attempt_user_completed", user_id, completed_at),
+    )
 
 
 class QuizAnswer(Base):
     """User's answer to a quiz question."""
     __tablename__ = "quiz_answers"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    attempt_id = Column(String(36), ForeignKey("quiz_attempts.id"), nullable=False)
-    question_id = Column(String(36), ForeignKey("quiz_questions.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    attempt_id = Column(Uuid, ForeignKey("quiz_attempts.id"), nullable=False)
+    question_id = Column(Uuid, ForeignKey("quiz_questions.id"), nullable=False)
     selected_answer = Column(String(500), nullable=False)
     is_correct = Column(Boolean, nullable=False)
     
     # Relationships
-    attempt = relationship("QuizAttempt", back_populates="answers")
+    attempt = relationship("QuizAttempt", back_populates="answers", lazy="raise")
 
 
 class LeaderboardCache(Base):
     """Cached leaderboard for performance."""
     __tablename__ = "leaderboard_cache"
     
-    id = Column(String(36), primary_key=True, default=generate_uuid)
-    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Uuid, ForeignKey("users.id"), nullable=False)
     week_start = Column(Date, nullable=False, index=True)
     weekly_points = Column(Integer, default=0)
     rank = Column(Integer, nullable=True)
     articles_read = Column(Integer, default=0)
     quiz_accuracy = Column(Float, nullable=True)
     reading_time_minutes = Column(Integer, default=0)
-    updated_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        # One cache row per user per week; target of the refresh upsert
+        UniqueConstraint("user_id", "week_start", name="uq_leaderboard_user_week"),
+        # Backs the weekly top-K ranking scan
+        Index("idx_leaderboard_week_points", week_start, weekly_points.desc()),
+    )
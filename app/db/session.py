@@ -1,30 +1,68 @@
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from app.core.config import get_settings
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from app.core.config import settings
 
-settings = get_settings()
 
-# Create database engine
+
+def _async_database_url(url: str) -> str:
+    """Map the configured database URL to its async driver equivalent."""
+    if url.startswith("postgresql://"):
+        return url.replace("postgresql://", "postgresql+asyncpg://", 1)
+    if url.startswith("sqlite://"):
+        return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    return url
+
+
+# Pool sizing: the defaults (5 + 10 overflow) exhaust under moderate
+# concurrency; pre_ping and recycle guard against stale connections
+# after Postgres restarts or idle timeouts
+_pool_kwargs = dict(
+    pool_size=20,
+    max_overflow=40,
+    pool_recycle=3600,
+    pool_pre_ping=True,
+    pool_timeout=30,
+    # Batched INSERT..VALUES flushes up to this many rows per statement
+    insertmanyvalues_page_size=500,
+)
+
+# Sync engine, used by the Kafka consumer and one-off scripts
 # For SQLite, we need connect_args to allow multi-threading
+# (SQLite manages no server-side connections, so pool tuning is moot)
 if settings.database_url.startswith("sqlite"):
     engine = create_engine(
         settings.database_url,
         connect_args={"check_same_thread": False}
     )
 else:
-    engine = create_engine(settings.database_url)
+    engine = create_engine(settings.database_url, **_pool_kwargs)
+
+# Sync session factory (consumer / scripts); expire_on_commit=False
+# avoids the re-SELECT on attribute access after commit
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
+
+# Async engine, used by the API request handlers so DB calls
+# don't block the event loop
+_async_url = _async_database_url(settings.database_url)
+if _async_url.startswith("sqlite"):
+    async_engine = create_async_engine(_async_url)
+else:
+    async_engine = create_async_engine(_async_url, **_pool_kwargs)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async session factory; expire_on_commit=False avoids implicit
+# re-SELECTs when attributes are read after commit
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
 
 # Base class for models
 Base = declarative_base()
 
 
-def get_db():
-    """Dependency to get database session."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def get_db():
+    """Dependency to get an async database session."""
+    async with AsyncSessionLocal() as session:
+        yield session
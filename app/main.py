@@ -2,34 +2,47 @@ from contextlib import asynccontextmanager
 import asyncio
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import logging
 
-from app.core.config import get_settings
-from app.db import Base, engine
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.core.cache import redis_cache
+from app.db import async_engine
 from app.api import auth_router, news_router, user_router, gamification_router
+from app.api.news import news_refresh_loop
 from app.services import kafka_producer, ai_news_consumer
+from app.services.http import close_shared_client
+from app.services.leaderboard import leaderboard_refresh_loop
 
-settings = get_settings()
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# Background task reference
+# Background task references
 consumer_task = None
+leaderboard_task = None
+news_refresh_task = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global consumer_task
+    global consumer_task, leaderboard_task, news_refresh_task
     
     # Startup
     logger.info("Starting up AI News Ecosystem...")
     
-    # Create database tables
-    Base.metadata.create_all(bind=engine)
-    logger.info("Database tables created")
+    # Schema is managed by Alembic (run `alembic upgrade head` before
+    # boot); here we only verify the database is reachable
+    try:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        logger.info("Database connection verified")
+    except Exception as e:
+        logger.warning(f"Database connectivity check failed: {e}")
     
     # Start Kafka producer
     try:
@@ -38,18 +51,35 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Kafka producer failed to start: {e}")
     
-    # Start AI consumer as background task
-    try:
-        consumer_task = asyncio.create_task(ai_news_consumer.start())
-        logger.info("AI News Consumer started as background task")
-    except Exception as e:
-        logger.warning(f"AI News Consumer failed to start: {e}")
-    
+    # The AI consumer normally runs as separate app.consumer_runner
+    # replicas (Kafka partition parallelism, no contention with HTTP
+    # handling); in-process mode is an opt-in for single-process dev
+    if settings.run_consumer_in_process:
+        try:
+            consumer_task = asyncio.create_task(ai_news_consumer.start())
+            logger.info("AI News Consumer started as background task")
+        except Exception as e:
+            logger.warning(f"AI News Consumer failed to start: {e}")
+
+    # Start periodic leaderboard cache refresh
+    leaderboard_task = asyncio.create_task(leaderboard_refresh_loop())
+    logger.info("Leaderboard cache refresh task started")
+
+    # Start periodic news refresh so cold requests never wait on NewsAPI
+    news_refresh_task = asyncio.create_task(news_refresh_loop())
+    logger.info("News refresh task started")
+
     yield
-    
+
     # Shutdown
     logger.info("Shutting down...")
-    
+
+    # Stop background refresh tasks
+    if leaderboard_task:
+        leaderboard_task.cancel()
+    if news_refresh_task:
+        news_refresh_task.cancel()
+
     # Stop AI consumer
     if consumer_task:
         try:
@@ -64,13 +94,19 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    # Close shared outbound HTTP pool and Redis connections
+    await close_shared_client()
+    await redis_cache.close()
+
 
-# Create FastAPI application
+# Create FastAPI application; orjson encodes every response (native
+# datetime/UUID handling, much faster on large list payloads)
 app = FastAPI(
     title=settings.app_name,
     description="AI-powered news ecosystem with personalized summaries and gamification",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -107,8 +143,9 @@ async def health_check():
 
 @app.get("/consumer/status")
 async def consumer_status():
-    """Check AI Consumer status."""
+    """Check AI Consumer status (in-process mode only)."""
     return {
+        "consumer_in_process": settings.run_consumer_in_process,
         "consumer_running": ai_news_consumer.running,
         "kafka_topic": "news-raw"
     }
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, TypeAdapter
 from uuid import UUID
 
 
@@ -34,9 +34,8 @@ class UserResponse(BaseModel):
     articles_read_count: int = 0
     created_at: datetime
     taste_profile: Optional["TasteProfileResponse"] = None
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class Token(BaseModel):
@@ -62,9 +61,8 @@ class ArticleSummaryResponse(BaseModel):
     mode: str
     summary: str
     generated_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ArticleJargonResponse(BaseModel):
@@ -72,9 +70,8 @@ class ArticleJargonResponse(BaseModel):
     term: str
     definition: str
     difficulty: str
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ArticleResponse(BaseModel):
@@ -88,17 +85,46 @@ class ArticleResponse(BaseModel):
     ingested_at: datetime
     summaries: List[ArticleSummaryResponse] = []
     jargon: List[ArticleJargonResponse] = []
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ArticleListItem(BaseModel):
+    """Schema for article list entries — no full body; fetch the
+    article detail endpoint for content."""
+    id: UUID
+    title: str
+    source_url: Optional[str]
+    category: Optional[str]
+    published_at: Optional[datetime]
+    ingested_at: datetime
+    summaries: List[ArticleSummaryResponse] = []
+    jargon: List[ArticleJargonResponse] = []
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ArticleListResponse(BaseModel):
-    """Schema for paginated article list."""
-    items: List[ArticleResponse]
-    total: int
-    page: int
+    """Schema for cursor-paginated article list."""
+    items: List[ArticleListItem]
     page_size: int
+    next_cursor: Optional[str] = None
+
+
+# ============ AI Pipeline Schemas ============
+
+class JargonItem(BaseModel):
+    """One jargon term extracted by the AI pipeline."""
+    term: str
+    definition: str = ""
+    difficulty: str = "intermediate"
+
+
+class ArticleAIResult(BaseModel):
+    """Parsed output of the fused per-article Gemini call."""
+    kid_summary: Optional[str] = None
+    pro_summary: Optional[str] = None
+    jargon: List[JargonItem] = Field(default_factory=list)
 
 
 # ============ Profile Schemas ============
@@ -117,9 +143,8 @@ class TasteProfileResponse(BaseModel):
     summary_mode: str
     reading_level: int
     topic_weights: dict
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 # ============ Gamification Schemas ============
@@ -129,9 +154,8 @@ class PointsResponse(BaseModel):
     points: int
     action_type: str
     earned_at: datetime
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class PointsHistoryResponse(BaseModel):
@@ -166,9 +190,8 @@ class QuizQuestionResponse(BaseModel):
     question: str
     options: List[str]
     points_value: int
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuizResponse(BaseModel):
@@ -177,9 +200,8 @@ class QuizResponse(BaseModel):
     week_start: datetime
     week_end: datetime
     questions: List[QuizQuestionResponse]
-    
-    class Config:
-        from_attributes = True
+
+    model_config = ConfigDict(from_attributes=True)
 
 
 class QuizAnswerSubmit(BaseModel):
@@ -200,3 +222,11 @@ class QuizResultResponse(BaseModel):
     points_earned: int
     correct_answers: int
     total_questions: int
+
+
+# ============ List Adapters ============
+# Built once at import so the validator/serializer pipeline for the
+# hot list endpoints is compiled up front, not on first request
+
+ArticleListAdapter = TypeAdapter(List[ArticleListItem])
+PointsListAdapter = TypeAdapter(List[PointsResponse])
@@ -8,24 +8,57 @@ Kafka consumer that processes raw news articles:
 4. Saves processed data to PostgreSQL
 """
 
-import json
 import asyncio
 import logging
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+import msgspec
 
-from app.core.config import get_settings
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, load_only
+
+from app.core.cache import redis_cache
+from app.core.config import settings
 from app.db import SessionLocal, Article, ArticleSummary, ArticleJargon
 from app.services.gemini import gemini_service
 from app.services.factcheck import factcheck_service
 from app.services.kafka_service import KafkaConsumerService
+from app.services.summary_cache import summary_cache, content_key
 
-settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# The batch save is synchronous SQLAlchemy; running it here would block
+# the event loop and stall every in-flight Gemini/FactCheck call, so it
+# runs on this small thread pool instead
+_db_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="db-save")
+
+
+class ArticleMsg(msgspec.Struct):
+    """Typed view of a news-raw Kafka message.
+
+    msgspec decodes straight into the struct — one pass for parse and
+    validation, attribute access instead of per-field dict lookups.
+    """
+    id: str
+    title: str = ""
+    content: str = ""
+
+
+_article_decoder = msgspec.json.Decoder(ArticleMsg)
+
+
+def _decode_article(value: bytes) -> Optional[ArticleMsg]:
+    """Deserializer for the consumer; malformed messages become None."""
+    try:
+        return _article_decoder.decode(value)
+    except msgspec.DecodeError as e:
+        logger.warning(f"Dropping undecodable message: {e}")
+        return None
+
 
 class AINewsConsumer:
     """
@@ -38,12 +71,29 @@ class AINewsConsumer:
     - Saves all processed data to PostgreSQL
     """
     
+    # Per-service concurrency caps so a full batch in flight doesn't
+    # trip Gemini / FactCheck rate limits
+    GEMINI_CONCURRENCY = 8
+    FACTCHECK_CONCURRENCY = 8
+
+    # Worker pool: polling and AI processing overlap through a bounded
+    # queue; the queue size caps in-flight messages for backpressure
+    WORKER_COUNT = 16
+    QUEUE_MAXSIZE = 100
+
     def __init__(self):
         self.consumer = KafkaConsumerService(
             topic="news-raw",
-            group_id="ai-processor-group"
+            group_id="ai-processor-group",
+            enable_auto_commit=False,
+            value_deserializer=_decode_article
         )
         self.running = False
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.QUEUE_MAXSIZE)
+        self._workers: list = []
+        self._pending: list = []
+        self._gemini_sem = asyncio.Semaphore(self.GEMINI_CONCURRENCY)
+        self._factcheck_sem = asyncio.Semaphore(self.FACTCHECK_CONCURRENCY)
     
     async def start(self):
         """Start the consumer and begin processing messages."""
@@ -53,199 +103,329 @@ class AINewsConsumer:
         try:
             await self.consumer.start()
             logger.info("AI News Consumer connected to Kafka")
-            
-            async for message in self.consumer.consume():
-                if not self.running:
-                    break
-                    
+
+            self._workers = [
+                asyncio.create_task(self._worker())
+                for _ in range(self.WORKER_COUNT)
+            ]
+
+            # Batch polling amortizes the poll/dispatch overhead; the
+            # queue lets the next poll overlap with in-flight AI calls.
+            # Offsets are committed only after the batch is processed
+            # and persisted, preserving at-least-once delivery.
+            while self.running:
+                batch = await self.consumer.consume_batch(
+                    max_records=settings.consumer_batch_size,
+                    timeout_ms=settings.consumer_batch_timeout_ms
+                )
+                if not batch:
+                    continue
+
+                for message in batch:
+                    if message is not None:
+                        await self.queue.put(message)
+
+                await self.queue.join()
+                if not await self._flush_pending():
+                    # Seek back to the batch's start offsets so the
+                    # same messages are polled again (at-least-once);
+                    # merely skipping commit() would not redeliver —
+                    # the consumer's position has already advanced
+                    self.consumer.rewind_batch()
+                    continue
                 try:
-                    await self.process_article(message)
+                    await self.consumer.commit()
                 except Exception as e:
-                    logger.error(f"Error processing article: {e}")
-                    continue
-                    
+                    logger.error(f"Offset commit failed: {e}")
+
         except Exception as e:
             logger.error(f"Consumer error: {e}")
         finally:
             await self.stop()
-    
+
+    async def _worker(self):
+        """Pull messages off the queue and process them."""
+        while True:
+            message = await self.queue.get()
+            try:
+                result = await self.process_article(message)
+                if result:
+                    self._pending.append(result)
+            except Exception as e:
+                logger.error(f"Error processing article: {e}")
+            finally:
+                self.queue.task_done()
+
+    async def _flush_pending(self) -> bool:
+        """Persist accumulated worker results in one batch save.
+
+        The synchronous save runs on _db_executor so the event loop
+        stays free for concurrent AI calls. Returns True if the batch
+        is safely in the database (or there was nothing to save), so
+        the caller knows whether committing the batch's offsets is
+        safe.
+        """
+        if not self._pending:
+            return True
+        batch, self._pending = self._pending, []
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                _db_executor, self._save_batch_to_database, batch
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Batch save failed: {e}")
+            return False
+
     async def stop(self):
         """Stop the consumer."""
         self.running = False
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+        await self._flush_pending()
         await self.consumer.stop()
         logger.info("AI News Consumer stopped")
     
-    async def process_article(self, article_data: dict):
+    async def process_article(self, article_data: ArticleMsg) -> Optional[dict]:
         """
         Process a raw article with AI services.
-        
+
         Args:
-            article_data: Dict containing article info from Kafka
+            article_data: Decoded news-raw message
+
+        Returns:
+            Dict of processed results for the batch save, or None if
+            the message was skipped.
         """
-        article_id = article_data.get("id")
-        title = article_data.get("title", "")
-        content = article_data.get("content", "")
-        
-        if not article_id or not content:
+        title = article_data.title
+        content = article_data.content
+
+        if not article_data.id or not content:
             logger.warning("Received article without id or content, skipping")
-            return
-        
+            return None
+
+        # Coerce the wire-format string id once; the Uuid columns don't
+        # accept raw strings on non-native backends (SQLite)
+        try:
+            article_id = UUID(article_data.id)
+        except ValueError:
+            logger.warning(f"Received article with malformed id {article_data.id!r}, skipping")
+            return None
+
         logger.info(f"Processing article: {title[:50]}...")
-        
-        # Run AI tasks concurrently
-        kid_summary_task = self._generate_summary(content, "kid")
-        pro_summary_task = self._generate_summary(content, "pro")
-        jargon_task = self._extract_jargon(content)
-        factcheck_task = self._check_veracity(title, content)
-        
-        # Wait for all tasks
-        kid_summary, pro_summary, jargon_list, veracity_data = await asyncio.gather(
-            kid_summary_task,
-            pro_summary_task,
-            jargon_task,
-            factcheck_task,
+
+        # Truncate once up front: summaries and jargon come from the
+        # lead of the article anyway, and this caps prompt tokens (and
+        # the cache key basis) for multi-KB bodies
+        trimmed = content[:12_000]
+
+        # One fused Gemini call covers both summaries and jargon;
+        # FactCheck is a separate API and runs concurrently with it
+        ai_result, veracity_data = await asyncio.gather(
+            self._generate_ai_content(trimmed),
+            self._check_veracity(title, trimmed),
             return_exceptions=True
         )
-        
+
         # Handle any exceptions from concurrent tasks
-        if isinstance(kid_summary, Exception):
-            logger.error(f"Kid summary generation failed: {kid_summary}")
-            kid_summary = None
-        if isinstance(pro_summary, Exception):
-            logger.error(f"Pro summary generation failed: {pro_summary}")
-            pro_summary = None
-        if isinstance(jargon_list, Exception):
-            logger.error(f"Jargon extraction failed: {jargon_list}")
-            jargon_list = []
+        if isinstance(ai_result, Exception):
+            logger.error(f"AI content generation failed: {ai_result}")
+            kid_summary, pro_summary, jargon_list = None, None, []
+        else:
+            kid_summary, pro_summary, jargon_list = ai_result
         if isinstance(veracity_data, Exception):
             logger.error(f"Veracity check failed: {veracity_data}")
             veracity_data = {"veracity_score": None, "claims": []}
         
-        # Save to database
-        await self._save_to_database(
-            article_id=article_id,
-            kid_summary=kid_summary,
-            pro_summary=pro_summary,
-            jargon_list=jargon_list,
-            veracity_data=veracity_data
-        )
-        
         logger.info(f"Completed processing article: {article_id}")
+        return {
+            "article_id": article_id,
+            "kid_summary": kid_summary,
+            "pro_summary": pro_summary,
+            "jargon_list": jargon_list,
+            "veracity_data": veracity_data,
+        }
     
-    async def _generate_summary(self, content: str, mode: str) -> Optional[str]:
-        """Generate article summary using Gemini."""
+    async def _cached_summary(self, content: str, mode: str) -> Optional[str]:
+        """Look up a summary in the content-hash cache tiers.
+
+        Duplicate content (re-ingested articles) is served from the
+        in-process cache first, then Redis, without touching the LLM.
+        """
+        key = content_key(content, mode)
+        cached = summary_cache.get(key)
+        if cached:
+            return cached
+
+        redis_hit = await redis_cache.get(f"sumhash:{key}")
+        if redis_hit:
+            summary_cache.put(key, redis_hit)
+        return redis_hit
+
+    async def _store_summary(self, content: str, mode: str, summary: str):
+        """Store a freshly generated summary in both cache tiers."""
+        key = content_key(content, mode)
+        summary_cache.put(key, summary)
+        await redis_cache.setex(f"sumhash:{key}", 86400, summary)
+
+    async def _generate_ai_content(self, content: str) -> tuple:
+        """Produce (kid_summary, pro_summary, jargon_list) for an article.
+
+        Both summaries are checked against the content-hash cache
+        first; only when one is missing does the fused Gemini call run,
+        producing summaries and jargon in a single request instead of
+        three.
+        """
+        kid_summary = await self._cached_summary(content, "kid")
+        pro_summary = await self._cached_summary(content, "pro")
+
+        if kid_summary and pro_summary:
+            # Summaries cached: jargon is the only thing left to generate
+            return kid_summary, pro_summary, await self._extract_jargon(content)
+
         try:
-            summary = await gemini_service.generate_summary(content, mode)
-            return summary
+            async with self._gemini_sem:
+                result = await gemini_service.process_article(content)
         except Exception as e:
-            logger.error(f"Summary generation error ({mode}): {e}")
-            return None
-    
+            logger.error(f"Fused article processing error: {e}")
+            return kid_summary, pro_summary, []
+
+        if not kid_summary and result.kid_summary:
+            kid_summary = result.kid_summary
+            await self._store_summary(content, "kid", kid_summary)
+        if not pro_summary and result.pro_summary:
+            pro_summary = result.pro_summary
+            await self._store_summary(content, "pro", pro_summary)
+
+        jargon_list = [item.model_dump() for item in result.jargon]
+        return kid_summary, pro_summary, jargon_list
+
     async def _extract_jargon(self, content: str) -> list:
         """Extract technical jargon from article."""
         try:
-            jargon = await gemini_service.extract_jargon(content)
+            async with self._gemini_sem:
+                jargon = await gemini_service.extract_jargon(content)
             return jargon if isinstance(jargon, list) else []
         except Exception as e:
             logger.error(f"Jargon extraction error: {e}")
             return []
-    
+
     async def _check_veracity(self, title: str, content: str) -> dict:
         """Check article veracity using FactCheck API."""
         try:
-            # Use title for primary claim check
-            result = await factcheck_service.check_claim(title)
-            
-            # If no results from title, try first sentence of content
-            if result.get("status") == "no_matching_claims" and content:
-                first_sentence = content.split('.')[0][:200]
-                result = await factcheck_service.check_claim(first_sentence)
-            
+            async with self._factcheck_sem:
+                # Use title for primary claim check
+                result = await factcheck_service.check_claim(title)
+
+                # If no results from title, try first sentence of content
+                if result.get("status") == "no_matching_claims" and content:
+                    # partition on a bounded slice: O(1) in article
+                    # length, no per-sentence list allocation
+                    first_sentence = content[:400].partition('.')[0][:200]
+                    result = await factcheck_service.check_claim(first_sentence)
+
             return result
         except Exception as e:
             logger.error(f"Veracity check error: {e}")
             return {"veracity_score": None, "claims": [], "status": "error"}
     
-    async def _save_to_database(
-        self,
-        article_id: str,
-        kid_summary: Optional[str],
-        pro_summary: Optional[str],
-        jargon_list: list,
-        veracity_data: dict
-    ):
-        """Save processed article data to PostgreSQL."""
+    def _save_batch_to_database(self, batch: list):
+        """Save a batch of processed results in one session/commit.
+
+        Articles are pre-fetched with one IN query, summaries go
+        through a single native upsert keyed on the (article_id, mode)
+        unique constraint, jargon rows through one bulk insert, and
+        stale jargon is cleared with a single DELETE — instead of
+        several statements per article.
+        """
         db: Session = SessionLocal()
-        
+        # One timestamp for the whole batch instead of a clock read per
+        # summary row
+        now = datetime.now(timezone.utc)
+
         try:
-            # Get or verify article exists
-            article = db.query(Article).filter(Article.id == article_id).first()
-            
-            if not article:
-                logger.warning(f"Article {article_id} not found in database")
-                return
-            
-            # Update article with veracity score
-            if veracity_data.get("veracity_score") is not None or veracity_data.get("claims"):
-                article.veracity_score = veracity_data.get("veracity_score")
-                article.veracity_claims = veracity_data.get("claims", [])
-                article.veracity_checked_at = datetime.utcnow()
-                logger.info(f"Veracity score for {article_id}: {veracity_data.get('veracity_score')}")
-            
-            # Save Kid summary
-            if kid_summary:
-                existing_kid = db.query(ArticleSummary).filter(
-                    ArticleSummary.article_id == article_id,
-                    ArticleSummary.mode == "kid"
-                ).first()
-                
-                if existing_kid:
-                    existing_kid.summary = kid_summary
-                    existing_kid.generated_at = datetime.utcnow()
-                else:
-                    db.add(ArticleSummary(
-                        article_id=article_id,
-                        mode="kid",
-                        summary=kid_summary
-                    ))
-            
-            # Save Pro summary
-            if pro_summary:
-                existing_pro = db.query(ArticleSummary).filter(
-                    ArticleSummary.article_id == article_id,
-                    ArticleSummary.mode == "pro"
-                ).first()
-                
-                if existing_pro:
-                    existing_pro.summary = pro_summary
-                    existing_pro.generated_at = datetime.utcnow()
-                else:
-                    db.add(ArticleSummary(
+            article_ids = [result["article_id"] for result in batch]
+            articles = {
+                a.id: a
+                for a in db.query(Article).options(
+                    load_only(Article.id, Article.veracity_score,
+                              Article.fact_check_claims)
+                ).filter(Article.id.in_(article_ids)).all()
+            }
+            summary_rows = []
+            new_jargon = []
+            jargon_article_ids = []
+
+            for result in batch:
+                article_id = result["article_id"]
+                article = articles.get(article_id)
+                if not article:
+                    logger.warning(f"Article {article_id} not found in database")
+                    continue
+
+                # Update article with veracity score
+                veracity_data = result["veracity_data"]
+                if veracity_data.get("veracity_score") is not None or veracity_data.get("claims"):
+                    article.veracity_score = veracity_data.get("veracity_score")
+                    article.fact_check_claims = veracity_data.get("claims", [])
+                    logger.info(f"Veracity score for {article_id}: {veracity_data.get('veracity_score')}")
+
+                # Collect Kid/Pro summaries for the single upsert below
+                for mode in ("kid", "pro"):
+                    summary_text = result[f"{mode}_summary"]
+                    if summary_text:
+                        summary_rows.append({
+                            "article_id": article_id,
+                            "mode": mode,
+                            "summary": summary_text,
+                            "generated_at": now,
+                        })
+
+                # Collect jargon terms; old rows are cleared below
+                jargon_rows = [
+                    ArticleJargon(
                         article_id=article_id,
-                        mode="pro",
-                        summary=pro_summary
-                    ))
-            
-            # Save jargon terms
-            if jargon_list:
-                # Clear existing jargon for this article
+                        term=item.get("term", ""),
+                        definition=item.get("definition", ""),
+                        difficulty=item.get("difficulty", "intermediate")
+                    )
+                    for item in result["jargon_list"]
+                    if isinstance(item, dict) and item.get("term")
+                ]
+                if jargon_rows:
+                    jargon_article_ids.append(article_id)
+                    new_jargon.extend(jargon_rows)
+
+            # Clear stale jargon for refreshed articles in one statement
+            if jargon_article_ids:
                 db.query(ArticleJargon).filter(
-                    ArticleJargon.article_id == article_id
-                ).delete()
-                
-                # Add new jargon terms
-                for item in jargon_list:
-                    if isinstance(item, dict) and item.get("term"):
-                        db.add(ArticleJargon(
-                            article_id=article_id,
-                            term=item.get("term", ""),
-                            definition=item.get("definition", ""),
-                            difficulty=item.get("difficulty", "intermediate")
-                        ))
-            
+                    ArticleJargon.article_id.in_(jargon_article_ids)
+                ).delete(synchronize_session=False)
+
+            if summary_rows:
+                # Insert-or-update in one statement, racing writers
+                # resolved by the (article_id, mode) unique constraint
+                insert_fn = (
+                    sqlite_insert if db.get_bind().dialect.name == "sqlite"
+                    else pg_insert
+                )
+                stmt = insert_fn(ArticleSummary).values(summary_rows)
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=["article_id", "mode"],
+                    set_={
+                        "summary": stmt.excluded.summary,
+                        "generated_at": stmt.excluded.generated_at,
+                    },
+                )
+                db.execute(stmt)
+
+            if new_jargon:
+                db.bulk_save_objects(new_jargon)
+
             db.commit()
-            logger.info(f"Saved processed data for article {article_id}")
-            
+            logger.info(f"Saved processed data for {len(batch)} article(s)")
+
         except Exception as e:
             db.rollback()
             logger.error(f"Database save error: {e}")
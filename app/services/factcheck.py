@@ -5,23 +5,52 @@ Checks news content against Google FactCheck Claims API
 to determine veracity/credibility score.
 """
 
-import httpx
 import logging
+from hashlib import blake2b
 from typing import Optional, List, Dict
-from app.core.config import get_settings
 
-settings = get_settings()
+import orjson
+
+from app.core.cache import redis_cache
+from app.core.config import settings
+from app.services.http import shared_client
+from app.services.summary_cache import ClockCache
+
 logger = logging.getLogger(__name__)
 
 # Google FactCheck API endpoint
 FACTCHECK_API_URL = "https://factchecktools.googleapis.com/v1alpha1/claims:search"
 
+# Wire services mirror each other's headlines constantly, so identical
+# claims recur across sources; cached verdicts skip the ~0.3-1s API call
+FACTCHECK_CACHE_TTL_SECONDS = 3600
+
+
+def claim_key(claim_text: str) -> str:
+    """Stable cache key for a claim, normalized like the API query."""
+    return blake2b(claim_text[:200].lower().encode(), digest_size=16).hexdigest()
+
+
+# Ordered keyword table for textual ratings: one scan, first hit wins.
+# Compound phrases come before their bare substrings ("mostly true"
+# before "true") so they can't be shadowed.
+_RATING_TABLE = (
+    (("mostly true", "mostly accurate", "largely true"), 80),
+    (("mostly false", "mostly inaccurate", "largely false"), 20),
+    (("half true", "mixed", "partly", "partially"), 50),
+    (("unverifiable", "unrated", "satire"), None),
+    (("true", "accurate", "correct", "verified"), 100),
+    (("false", "fake", "incorrect", "wrong", "pants on fire"), 0),
+)
+
 
 class FactCheckService:
     """Service for checking claims against Google FactCheck API."""
     
     def __init__(self):
         self.api_key = settings.gemini_api_key  # Can use same API key for Google APIs
+        # In-process tier of the claim cache; Redis is the shared tier
+        self._cache = ClockCache()
         
     async def check_claim(self, claim_text: str, language: str = "en") -> Dict:
         """
@@ -37,28 +66,47 @@ class FactCheckService:
         if not self.api_key:
             logger.warning("No API key configured for FactCheck")
             return {"veracity_score": None, "claims": [], "status": "no_api_key"}
-        
+
+        key = claim_key(claim_text)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        redis_hit = await redis_cache.get(f"factcheck:{key}")
+        if redis_hit:
+            result = orjson.loads(redis_hit)
+            self._cache.put(key, result)
+            return result
+
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    FACTCHECK_API_URL,
-                    params={
-                        "key": self.api_key,
-                        "query": claim_text[:200],  # Limit query length
-                        "languageCode": language
-                    }
+            response = await shared_client.get(
+                FACTCHECK_API_URL,
+                params={
+                    "key": self.api_key,
+                    "query": claim_text[:200],  # Limit query length
+                    "languageCode": language
+                }
+            )
+
+            if response.status_code == 200:
+                data = response.json()
+                result = self._process_response(data)
+                # Only definitive outcomes are cached; transient errors
+                # should be retried on the next occurrence
+                self._cache.put(key, result)
+                await redis_cache.setex(
+                    f"factcheck:{key}",
+                    FACTCHECK_CACHE_TTL_SECONDS,
+                    orjson.dumps(result),
                 )
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._process_response(data)
-                elif response.status_code == 403:
-                    logger.warning("FactCheck API access denied - API may not be enabled")
-                    return {"veracity_score": None, "claims": [], "status": "access_denied"}
-                else:
-                    logger.warning(f"FactCheck API returned status {response.status_code}")
-                    return {"veracity_score": None, "claims": [], "status": "error"}
-                    
+                return result
+            elif response.status_code == 403:
+                logger.warning("FactCheck API access denied - API may not be enabled")
+                return {"veracity_score": None, "claims": [], "status": "access_denied"}
+            else:
+                logger.warning(f"FactCheck API returned status {response.status_code}")
+                return {"veracity_score": None, "claims": [], "status": "error"}
+
         except Exception as e:
             logger.error(f"FactCheck API error: {e}")
             return {"veracity_score": None, "claims": [], "status": "error"}
@@ -112,31 +160,9 @@ class FactCheckService:
     def _rating_to_score(self, rating: str) -> Optional[int]:
         """Convert textual rating to numeric score (0-100)."""
         rating_lower = rating.lower()
-        
-        # True/Accurate ratings
-        if any(word in rating_lower for word in ["true", "accurate", "correct", "verified"]):
-            return 100
-        
-        # Mostly true
-        if any(word in rating_lower for word in ["mostly true", "mostly accurate", "largely true"]):
-            return 80
-        
-        # Mixed/Half true
-        if any(word in rating_lower for word in ["half true", "mixed", "partly", "partially"]):
-            return 50
-        
-        # Mostly false
-        if any(word in rating_lower for word in ["mostly false", "mostly inaccurate", "largely false"]):
-            return 20
-        
-        # False/Fake
-        if any(word in rating_lower for word in ["false", "fake", "incorrect", "wrong", "pants on fire"]):
-            return 0
-        
-        # Unverifiable/Unrated
-        if any(word in rating_lower for word in ["unverifiable", "unrated", "satire"]):
-            return None
-        
+        for keywords, score in _RATING_TABLE:
+            if any(word in rating_lower for word in keywords):
+                return score
         return None
 
 
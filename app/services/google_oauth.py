@@ -1,12 +1,12 @@
 """Google OAuth Service for authentication."""
-import httpx
 from typing import Optional, Dict, Any
 from dataclasses import dataclass
+from urllib.parse import urlencode
 import logging
 
-from app.core.config import get_settings
+from app.core.config import settings
+from app.services.http import shared_client
 
-settings = get_settings()
 logger = logging.getLogger(__name__)
 
 GOOGLE_TOKEN_URL = "https://oauth2.googleapis.com/token"
@@ -54,8 +54,7 @@ class GoogleOAuthService:
         if state:
             params["state"] = state
         
-        query_string = "&".join(f"{k}={v}" for k, v in params.items())
-        return f"{GOOGLE_AUTH_URL}?{query_string}"
+        return f"{GOOGLE_AUTH_URL}?{urlencode(params)}"
     
     async def exchange_code_for_tokens(self, code: str) -> Dict[str, Any]:
         """
@@ -67,23 +66,22 @@ class GoogleOAuthService:
         Returns:
             Token response containing access_token, id_token, etc.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                GOOGLE_TOKEN_URL,
-                data={
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "code": code,
-                    "grant_type": "authorization_code",
-                    "redirect_uri": self.redirect_uri,
-                },
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Token exchange failed: {response.text}")
-                raise ValueError("Failed to exchange authorization code")
-            
-            return response.json()
+        response = await shared_client.post(
+            GOOGLE_TOKEN_URL,
+            data={
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "code": code,
+                "grant_type": "authorization_code",
+                "redirect_uri": self.redirect_uri,
+            },
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Token exchange failed: {response.text}")
+            raise ValueError("Failed to exchange authorization code")
+
+        return response.json()
     
     async def get_user_info(self, access_token: str) -> GoogleUser:
         """
@@ -95,25 +93,24 @@ class GoogleOAuthService:
         Returns:
             GoogleUser object with user details
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                GOOGLE_USERINFO_URL,
-                headers={"Authorization": f"Bearer {access_token}"},
-            )
-            
-            if response.status_code != 200:
-                logger.error(f"Failed to get user info: {response.text}")
-                raise ValueError("Failed to get user information")
-            
-            data = response.json()
-            
-            return GoogleUser(
-                id=data["id"],
-                email=data["email"],
-                name=data.get("name", data["email"].split("@")[0]),
-                picture=data.get("picture"),
-                verified_email=data.get("verified_email", True),
-            )
+        response = await shared_client.get(
+            GOOGLE_USERINFO_URL,
+            headers={"Authorization": f"Bearer {access_token}"},
+        )
+
+        if response.status_code != 200:
+            logger.error(f"Failed to get user info: {response.text}")
+            raise ValueError("Failed to get user information")
+
+        data = response.json()
+
+        return GoogleUser(
+            id=data["id"],
+            email=data["email"],
+            name=data.get("name", data["email"].split("@")[0]),
+            picture=data.get("picture"),
+            verified_email=data.get("verified_email", True),
+        )
     
     async def authenticate(self, code: str) -> GoogleUser:
         """
@@ -0,0 +1,24 @@
+"""
+Shared HTTP Client
+
+One pooled httpx.AsyncClient for all outbound API calls (NewsAPI,
+FactCheck, Google OAuth). Keep-alive connections skip the per-call
+TCP+TLS handshake and HTTP/2 multiplexes concurrent requests over a
+single socket. Closed from the application lifespan on shutdown.
+"""
+
+import httpx
+
+shared_client = httpx.AsyncClient(
+    http2=True,
+    timeout=30.0,
+    limits=httpx.Limits(max_connections=200, max_keepalive_connections=100),
+    # brotli is installed, so ask for it explicitly; article JSON
+    # compresses 3-5x, cutting wire time on the NewsAPI-bound path
+    headers={"Accept-Encoding": "br, gzip, deflate"},
+)
+
+
+async def close_shared_client() -> None:
+    """Close the shared client's connection pool."""
+    await shared_client.aclose()
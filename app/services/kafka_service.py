@@ -1,10 +1,10 @@
-import json
 import logging
+
+import orjson
 from typing import Optional
 from aiokafka import AIOKafkaProducer, AIOKafkaConsumer
-from app.core.config import get_settings
+from app.core.config import settings
 
-settings = get_settings()
 logger = logging.getLogger(__name__)
 
 
@@ -16,25 +16,41 @@ class KafkaProducerService:
     
     async def start(self):
         """Start the Kafka producer."""
+        # linger + lz4 let consecutive sends coalesce into one
+        # compressed wire frame instead of a TCP write per message
         self.producer = AIOKafkaProducer(
             bootstrap_servers=settings.kafka_bootstrap_servers,
-            value_serializer=lambda v: json.dumps(v).encode('utf-8')
+            value_serializer=orjson.dumps,  # C-implemented, returns bytes directly
+            linger_ms=20,
+            compression_type="lz4",
+            acks=1,
+            max_batch_size=131072,
         )
         await self.producer.start()
         logger.info("Kafka producer started")
-    
+
+    async def flush(self):
+        """Wait for all buffered messages to reach the broker."""
+        if self.producer:
+            await self.producer.flush()
+
     async def stop(self):
-        """Stop the Kafka producer."""
+        """Stop the Kafka producer, flushing anything still buffered."""
         if self.producer:
             await self.producer.stop()
             logger.info("Kafka producer stopped")
     
     async def publish_raw_article(self, article_data: dict):
-        """Publish a raw article to the news-raw topic."""
+        """Publish a raw article to the news-raw topic.
+
+        Fire-and-forget: the message joins the current batch and goes
+        out within linger_ms; callers needing a delivery guarantee can
+        await flush().
+        """
         if not self.producer:
             raise RuntimeError("Producer not started")
-        
-        await self.producer.send_and_wait(
+
+        await self.producer.send(
             topic="news-raw",
             value=article_data
         )
@@ -52,11 +68,11 @@ class KafkaProducerService:
         logger.info(f"Published article to news-summarized: {article_data.get('title', 'Unknown')}")
     
     async def publish_user_event(self, event_data: dict):
-        """Publish a user event for analytics."""
+        """Publish a user event for analytics (fire-and-forget)."""
         if not self.producer:
             raise RuntimeError("Producer not started")
-        
-        await self.producer.send_and_wait(
+
+        await self.producer.send(
             topic="user-events",
             value=event_data
         )
@@ -66,21 +82,39 @@ class KafkaProducerService:
 class KafkaConsumerService:
     """Kafka consumer for processing news events."""
     
-    def __init__(self, topic: str, group_id: str):
+    def __init__(self, topic: str, group_id: str, enable_auto_commit: bool = True,
+                 value_deserializer=orjson.loads):
         self.topic = topic
         self.group_id = group_id
+        self.enable_auto_commit = enable_auto_commit
+        self.value_deserializer = value_deserializer
         self.consumer: Optional[AIOKafkaConsumer] = None
-    
+        self._batch_start_offsets: dict = {}
+
     async def start(self):
         """Start the Kafka consumer."""
+        # Fetch tuning pairs with consume_batch(): wait briefly for at
+        # least 64 KiB per fetch so the broker round trip is amortized
+        # over many messages instead of returning one at a time
         self.consumer = AIOKafkaConsumer(
             self.topic,
             bootstrap_servers=settings.kafka_bootstrap_servers,
             group_id=self.group_id,
-            value_deserializer=lambda v: json.loads(v.decode('utf-8'))
+            enable_auto_commit=self.enable_auto_commit,
+            value_deserializer=self.value_deserializer,
+            fetch_min_bytes=64 * 1024,
+            fetch_max_wait_ms=200,
+            max_partition_fetch_bytes=4 * 1024 * 1024,
+            auto_offset_reset="latest",
         )
         await self.consumer.start()
         logger.info(f"Kafka consumer started for topic: {self.topic}")
+
+    async def commit(self):
+        """Commit consumed offsets (manual-commit mode only)."""
+        if not self.consumer:
+            raise RuntimeError("Consumer not started")
+        await self.consumer.commit()
     
     async def stop(self):
         """Stop the Kafka consumer."""
@@ -92,10 +126,49 @@ class KafkaConsumerService:
         """Consume messages from the topic."""
         if not self.consumer:
             raise RuntimeError("Consumer not started")
-        
+
         async for message in self.consumer:
             yield message.value
 
+    async def consume_batch(self, max_records: int = 50, timeout_ms: int = 500) -> list:
+        """Poll up to max_records messages in one round trip.
+
+        Returns a (possibly empty) list of deserialized message values;
+        an empty list just means the poll timed out with nothing new.
+        """
+        if not self.consumer:
+            raise RuntimeError("Consumer not started")
+
+        batches = await self.consumer.getmany(
+            timeout_ms=timeout_ms, max_records=max_records
+        )
+        # Remember where this poll started per partition so a failed
+        # handler can rewind_batch() for redelivery
+        self._batch_start_offsets = {
+            tp: messages[0].offset
+            for tp, messages in batches.items()
+            if messages
+        }
+        return [
+            message.value
+            for messages in batches.values()
+            for message in messages
+        ]
+
+    def rewind_batch(self):
+        """Seek back to the start of the last consume_batch poll.
+
+        getmany advances the in-memory position even when offsets are
+        never committed, so simply skipping commit() does not cause
+        redelivery — the next successful commit would silently include
+        the failed batch. Seeking restores the position so the same
+        messages are polled again.
+        """
+        if not self.consumer:
+            raise RuntimeError("Consumer not started")
+        for tp, offset in self._batch_start_offsets.items():
+            self.consumer.seek(tp, offset)
+
 
 # Singleton instances
 kafka_producer = KafkaProducerService()
@@ -0,0 +1,131 @@
+"""
+Leaderboard Cache Service
+
+Periodically materializes weekly leaderboard rankings into the
+leaderboard_cache table so the /api/leaderboard endpoint serves
+pre-computed rows instead of aggregating the points ledger per request.
+"""
+
+import asyncio
+import logging
+from datetime import datetime, date, timedelta, timezone
+
+from sqlalchemy import select, func, case, and_, desc
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import AsyncSessionLocal, User, PointsLedger, QuizAttempt, LeaderboardCache
+
+logger = logging.getLogger(__name__)
+
+# How often the background task recomputes the cache
+REFRESH_INTERVAL_SECONDS = 60
+
+
+def current_week_start() -> date:
+    """Return the Monday of the current week."""
+    today = date.today()
+    return today - timedelta(days=today.weekday())
+
+
+async def refresh_leaderboard_cache(db: AsyncSession) -> int:
+    """
+    Recompute weekly rankings and upsert them into leaderboard_cache.
+
+    Returns the number of ranked users written.
+    """
+    week_start = current_week_start()
+    week_start_dt = datetime.combine(week_start, datetime.min.time(), tzinfo=timezone.utc)
+
+    # Weekly quiz stats per user, aggregated in SQL
+    quiz_stats = select(
+        QuizAttempt.user_id.label("user_id"),
+        func.sum(QuizAttempt.score).label("total_score"),
+        func.sum(QuizAttempt.max_score).label("max_score")
+    ).where(
+        QuizAttempt.completed_at >= week_start_dt
+    ).group_by(QuizAttempt.user_id).subquery()
+
+    # Single aggregate query: weekly points, articles read and quiz stats
+    # per user in one round trip, sorted and limited by the database
+    rows = (await db.execute(
+        select(
+            User.id,
+            User.total_reading_time_seconds,
+            func.coalesce(func.sum(case(
+                (PointsLedger.earned_at >= week_start_dt, PointsLedger.points),
+                else_=0
+            )), 0).label("weekly_points"),
+            func.coalesce(func.sum(case(
+                (and_(
+                    PointsLedger.earned_at >= week_start_dt,
+                    PointsLedger.action_type == "read_article"
+                ), 1),
+                else_=0
+            )), 0).label("articles_read"),
+            quiz_stats.c.total_score,
+            quiz_stats.c.max_score
+        ).outerjoin(
+            PointsLedger, PointsLedger.user_id == User.id
+        ).outerjoin(
+            quiz_stats, quiz_stats.c.user_id == User.id
+        ).group_by(
+            User.id, User.total_reading_time_seconds,
+            quiz_stats.c.total_score, quiz_stats.c.max_score
+        ).order_by(
+            desc("weekly_points")
+        ).limit(100)
+    )).all()
+
+    if not rows:
+        return 0
+
+    # One upsert for all ranks, keyed by the unique (user_id, week_start)
+    values = []
+    for rank, row in enumerate(rows, 1):
+        quiz_accuracy = None
+        if row.max_score:
+            quiz_accuracy = round(row.total_score / row.max_score * 100, 1)
+
+        values.append({
+            "user_id": row.id,
+            "week_start": week_start,
+            "weekly_points": row.weekly_points,
+            "rank": rank,
+            "articles_read": row.articles_read,
+            "quiz_accuracy": quiz_accuracy,
+            "reading_time_minutes": (row.total_reading_time_seconds or 0) // 60,
+            "updated_at": datetime.now(timezone.utc),
+        })
+
+    insert_fn = sqlite_insert if db.get_bind().dialect.name == "sqlite" else pg_insert
+    stmt = insert_fn(LeaderboardCache).values(values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["user_id", "week_start"],
+        set_={
+            "weekly_points": stmt.excluded.weekly_points,
+            "rank": stmt.excluded.rank,
+            "articles_read": stmt.excluded.articles_read,
+            "quiz_accuracy": stmt.excluded.quiz_accuracy,
+            "reading_time_minutes": stmt.excluded.reading_time_minutes,
+            "updated_at": stmt.excluded.updated_at,
+        },
+    )
+    await db.execute(stmt)
+    await db.commit()
+    return len(rows)
+
+
+async def leaderboard_refresh_loop():
+    """Background task that refreshes the leaderboard cache on an interval."""
+    while True:
+        async with AsyncSessionLocal() as db:
+            try:
+                count = await refresh_leaderboard_cache(db)
+                logger.info(f"Leaderboard cache refreshed ({count} users)")
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Leaderboard cache refresh failed: {e}")
+
+        await asyncio.sleep(REFRESH_INTERVAL_SECONDS)
@@ -1,14 +1,33 @@
 """NewsAPI.org Service for fetching live news articles."""
-import httpx
+import asyncio
+import re
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 
-from app.core.config import get_settings
+import orjson
+
+from app.core.config import settings
+from app.services.http import shared_client
 
-settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# Category keyword table, built once at import. _infer_category tokenizes
+# the content in a single pass and checks each category with a hashed set
+# intersection, instead of running a substring scan per keyword (which
+# also matched inside other words, e.g. "ai" in "aid"). Order is the
+# match priority: the first category with a keyword hit wins.
+_WORD_RE = re.compile(r"[a-z]+")
+_CATEGORY_KEYWORDS: List[tuple] = [
+    ("Technology", frozenset({"ai", "tech", "software", "app", "startup", "google", "apple", "microsoft"})),
+    ("Science", frozenset({"science", "research", "study", "discovery", "nasa", "space"})),
+    ("Business", frozenset({"market", "stock", "economy", "business", "company", "investment"})),
+    ("Health", frozenset({"health", "medical", "doctor", "hospital", "disease", "vaccine"})),
+    ("Sports", frozenset({"sport", "game", "team", "player", "score", "championship"})),
+    ("Entertainment", frozenset({"movie", "music", "celebrity", "entertainment", "show", "film"})),
+]
+
 
 class NewsAPIService:
     """Service for fetching news from NewsAPI.org."""
@@ -16,9 +35,14 @@ class NewsAPIService:
     def __init__(self):
         self.api_key = settings.news_api_key
         self.base_url = settings.news_api_base_url
-        self._last_fetch: Optional[datetime] = None
-        self._cache: List[Dict] = []
+        # (category, country, page_size) -> (fetched_at, articles);
+        # top headlines change on the order of minutes, so repeat calls
+        # inside the window skip the outbound request entirely
+        self._cache: Dict[tuple, tuple] = {}
         self._cache_duration = timedelta(minutes=30)
+        # Cold-cache requests in progress, so concurrent callers for the
+        # same key share one outbound request (single-flight)
+        self._inflight: Dict[tuple, asyncio.Future] = {}
     
     async def fetch_top_headlines(
         self,
@@ -40,7 +64,38 @@ class NewsAPIService:
         if not self.api_key:
             logger.warning("NEWS_API_KEY not configured, returning empty list")
             return []
-        
+
+        cache_key = (category, country, page_size)
+        cached = self._cache.get(cache_key)
+        if cached and datetime.now(timezone.utc) - cached[0] < self._cache_duration:
+            return cached[1]
+
+        # Coalesce concurrent misses: the first caller runs the request,
+        # later ones await its future. Safe without a lock because both
+        # the check and the insert happen before any await point.
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            return await inflight
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            result = await self._fetch_headlines(cache_key, category, country, page_size)
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(cache_key, None)
+            if not future.done():
+                future.cancel()
+
+    async def _fetch_headlines(
+        self,
+        cache_key: tuple,
+        category: Optional[str],
+        country: str,
+        page_size: int,
+    ) -> List[Dict[str, Any]]:
+        """Perform the actual NewsAPI request for a cache miss."""
         params = {
             "apiKey": self.api_key,
             "country": country,
@@ -51,23 +106,29 @@ class NewsAPIService:
             params["category"] = category.lower()
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/top-headlines",
-                    params=params,
-                    timeout=30.0
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"NewsAPI error: {response.text}")
-                    return []
-                
-                data = response.json()
-                articles = data.get("articles", [])
-                
-                # Transform to our format
-                return [self._transform_article(article) for article in articles if article.get("content")]
-                
+            response = await shared_client.get(
+                f"{self.base_url}/top-headlines",
+                params=params,
+                timeout=30.0
+            )
+
+            if response.status_code != 200:
+                logger.error(f"NewsAPI error: {response.text}")
+                return []
+
+            data = orjson.loads(response.content)
+            articles = data.get("articles", [])
+
+            # Transform to our format; a category-filtered request
+            # already tells us every article's category
+            known_category = category.capitalize() if category else None
+            result = [
+                self._transform_article(article, known_category)
+                for article in articles if article.get("content")
+            ]
+            self._cache[cache_key] = (datetime.now(timezone.utc), result)
+            return result
+
         except Exception as e:
             logger.error(f"Error fetching news: {e}")
             return []
@@ -108,22 +169,21 @@ class NewsAPIService:
             params["to"] = to_date.isoformat()
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/everything",
-                    params=params,
-                    timeout=30.0
-                )
-                
-                if response.status_code != 200:
-                    logger.error(f"NewsAPI search error: {response.text}")
-                    return []
-                
-                data = response.json()
-                articles = data.get("articles", [])
-                
-                return [self._transform_article(article) for article in articles if article.get("content")]
-                
+            response = await shared_client.get(
+                f"{self.base_url}/everything",
+                params=params,
+                timeout=30.0
+            )
+
+            if response.status_code != 200:
+                logger.error(f"NewsAPI search error: {response.text}")
+                return []
+
+            data = orjson.loads(response.content)
+            articles = data.get("articles", [])
+
+            return [self._transform_article(article) for article in articles if article.get("content")]
+
         except Exception as e:
             logger.error(f"Error searching news: {e}")
             return []
@@ -143,67 +203,85 @@ class NewsAPIService:
         Returns:
             Combined list of articles from all categories
         """
-        all_articles = []
-        
-        for category in categories:
-            articles = await self.fetch_top_headlines(
-                category=category,
-                page_size=articles_per_category
-            )
-            all_articles.extend(articles)
-        
+        if not categories:
+            return []
+
+        # All category requests run concurrently, so wall time is the
+        # slowest single request rather than the sum of all of them
+        results = await asyncio.gather(
+            *(
+                self.fetch_top_headlines(
+                    category=category,
+                    page_size=articles_per_category
+                )
+                for category in categories
+            ),
+            return_exceptions=True,
+        )
+
+        # The same wire story often shows up in several category feeds;
+        # dedupe on URL so downstream summarization and DB writes only
+        # see each story once
+        all_articles: List[Dict[str, Any]] = []
+        seen_urls: set = set()
+        for category, result in zip(categories, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error fetching category {category}: {result}")
+                continue
+            for article in result:
+                url = article.get("source_url")
+                if url and url in seen_urls:
+                    continue
+                if url:
+                    seen_urls.add(url)
+                all_articles.append(article)
+
         return all_articles
     
-    def _transform_article(self, article: Dict) -> Dict[str, Any]:
+    def _transform_article(
+        self, article: Dict, known_category: Optional[str] = None
+    ) -> Dict[str, Any]:
         """Transform NewsAPI article to our format."""
-        # Extract category from source or default
-        source_name = article.get("source", {}).get("name", "Unknown")
-        
-        # Determine category based on content or source
-        content = article.get("content", "") or article.get("description", "")
-        category = self._infer_category(content, source_name)
-        
+        # Hot per-article path: bind the dict lookup once and walk the
+        # nested source dict a single time
+        get = article.get
+        source = get("source") or {}
+        source_name = source.get("name", "Unknown")
+
+        # Determine category based on content or source, unless the
+        # upstream query was already filtered to one category
+        content = get("content") or get("description") or ""
+        category = known_category or self._infer_category(
+            content.lower()[:256], source_name
+        )
+
         return {
-            "title": article.get("title", "Untitled"),
-            "content": article.get("content", article.get("description", "")),
-            "description": article.get("description", ""),
-            "source_url": article.get("url", ""),
+            "title": get("title", "Untitled"),
+            "content": content,
+            "description": get("description", ""),
+            "source_url": get("url", ""),
             "source_name": source_name,
-            "image_url": article.get("urlToImage"),
-            "published_at": article.get("publishedAt"),
-            "author": article.get("author"),
+            "image_url": get("urlToImage"),
+            "published_at": get("publishedAt"),
+            "author": get("author"),
             "category": category,
         }
     
-    def _infer_category(self, content: str, source: str) -> str:
-        """Infer article category from content and source."""
-        content_lower = content.lower()
-        source_lower = source.lower()
-        
-        # Tech keywords
-        if any(word in content_lower for word in ["ai", "tech", "software", "app", "startup", "google", "apple", "microsoft"]):
-            return "Technology"
-        
-        # Science keywords
-        if any(word in content_lower for word in ["science", "research", "study", "discovery", "nasa", "space"]):
-            return "Science"
-        
-        # Business keywords
-        if any(word in content_lower for word in ["market", "stock", "economy", "business", "company", "investment"]):
-            return "Business"
-        
-        # Health keywords
-        if any(word in content_lower for word in ["health", "medical", "doctor", "hospital", "disease", "vaccine"]):
-            return "Health"
-        
-        # Sports keywords
-        if any(word in content_lower for word in ["sport", "game", "team", "player", "score", "championship"]):
-            return "Sports"
-        
-        # Entertainment keywords
-        if any(word in content_lower for word in ["movie", "music", "celebrity", "entertainment", "show", "film"]):
-            return "Entertainment"
-        
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _infer_category(content_prefix: str, source: str) -> str:
+        """Infer article category from a lowercased content prefix.
+
+        Memoized: the same wire story routinely appears under several
+        sources and across repeated fetches, so duplicate prefixes skip
+        the keyword scan entirely.
+        """
+        words = set(_WORD_RE.findall(content_prefix))
+
+        for category, keywords in _CATEGORY_KEYWORDS:
+            if words & keywords:
+                return category
+
         return "General"
 
 
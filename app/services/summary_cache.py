@@ -0,0 +1,77 @@
+"""
+Summary Cache
+
+In-process cache for generated summaries keyed by a hash of the article
+content, so re-ingested duplicate text skips the Gemini call entirely.
+Uses a Clock (second-chance) eviction policy: a hit just sets a
+reference bit, so the read path takes no lock at all; a Redis tier
+(managed by the caller) shares hits across pods.
+"""
+
+import hashlib
+from threading import Lock
+from typing import Optional
+
+MAX_ENTRIES = 8192
+
+
+def content_key(content: str, mode: str) -> str:
+    """Stable cache key for an article body + summary mode."""
+    digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{digest}:{mode}"
+
+
+class ClockCache:
+    """Fixed-capacity cache with Clock (second-chance) eviction.
+
+    Strict LRU splices a linked list under a mutex on every hit, which
+    turns the list head into a contention hotspot. Here a hit is a
+    single byte store into the reference bitmap — no lock — and only
+    insert/evict takes the lock, sweeping the clock hand until it finds
+    a slot whose reference bit is clear.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES):
+        self._capacity = max_entries
+        self._entries = {}  # key -> (value, slot index)
+        self._slots = [None] * max_entries  # slot index -> key
+        self._ref_bits = bytearray(max_entries)
+        self._hand = 0
+        self._lock = Lock()
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, idx = entry
+        self._ref_bits[idx] = 1  # lock-free: hits only mark the bit
+        return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries[key] = (value, entry[1])
+                self._ref_bits[entry[1]] = 1
+                return
+
+            # Sweep the hand, giving referenced slots a second chance
+            while True:
+                idx = self._hand
+                self._hand = (self._hand + 1) % self._capacity
+                victim = self._slots[idx]
+                if victim is None:
+                    break
+                if self._ref_bits[idx]:
+                    self._ref_bits[idx] = 0
+                    continue
+                del self._entries[victim]
+                break
+
+            self._slots[idx] = key
+            self._ref_bits[idx] = 1
+            self._entries[key] = (value, idx)
+
+
+# Singleton instance
+summary_cache = ClockCache()
@@ -1,11 +1,14 @@
-"""Initialize the database tables."""
-from app.db.session import engine, Base
-from app.db.models import (
-    User, TasteProfile, Article, ArticleSummary, ArticleJargon,
-    PointsLedger, WeeklyQuiz, QuizQuestion, QuizAttempt, QuizAnswer, LeaderboardCache
-)
+"""Initialize the database schema.
+
+Runs the Alembic chain (equivalent to `alembic upgrade head`) instead
+of Base.metadata.create_all: the old create_all path built the full
+schema without stamping alembic_version, leaving the database unable
+to take later migrations cleanly.
+"""
+from alembic import command
+from alembic.config import Config
 
 if __name__ == "__main__":
-    print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
-    print("Database tables created successfully!")
+    print("Applying database migrations...")
+    command.upgrade(Config("alembic.ini"), "head")
+    print("Database schema is up to date!")